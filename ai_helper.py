@@ -7,10 +7,18 @@ BountyX AI Helper - Analyzes vulnerability scan results and provides recommendat
 import os
 import sys
 import json
-import argparse
-import glob
-from datetime import datetime
+import textwrap
+import hashlib
+import importlib.util
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from html import escape
+from typing import ClassVar, Optional
+import io
 import re
+import threading
+import time
 import logging
 
 # Configure logging
@@ -20,1028 +28,270 @@ logging.basicConfig(
 )
 logger = logging.getLogger('bountyx_ai')
 
-# Check if any AI models are available
-try:
-    import openai
-    OPENAI_AVAILABLE = True
+# Check if any AI models are available. The modules themselves are only
+# imported when AI analysis runs, since transformers pulls in torch.
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+if OPENAI_AVAILABLE:
     logger.info("OpenAI module detected")
-except ImportError:
-    OPENAI_AVAILABLE = False
+else:
     logger.warning("OpenAI module not found")
 
-try:
-    from transformers import pipeline
-    TRANSFORMERS_AVAILABLE = True
+TRANSFORMERS_AVAILABLE = importlib.util.find_spec("transformers") is not None
+if TRANSFORMERS_AVAILABLE:
     logger.info("Transformers module detected")
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
+else:
     logger.warning("Transformers module not found")
 
-class BountyXAI:
-    def __init__(self, input_dir, output_format="json"):
-        self.input_dir = input_dir
-        self.output_format = output_format
-        self.results = {}
-        self.analysis = {}
-        self.recommendations = {}
-        self.priorities = {}
+SUMMARIZATION_MODEL = "sshleifer/distilbart-cnn-12-6"
 
-    def load_results(self):
-        """Load all results from the results directory"""
-        logger.info(f"Loading results from {self.input_dir}")
-        
-        # Load subdomain results
-        subdomain_files = glob.glob(f"{self.input_dir}/subdomains/*.json")
-        if subdomain_files:
-            try:
-                with open(subdomain_files[0], 'r') as f:
-                    self.results['subdomains'] = json.load(f)
-                logger.info(f"Loaded {len(self.results.get('subdomains', {}).get('subdomains', []))} subdomains")
-            except Exception as e:
-                logger.error(f"Error loading subdomain results: {e}")
-        
-        # Load port scan results
-        port_files = glob.glob(f"{self.input_dir}/ports/*.json")
-        if port_files:
-            try:
-                with open(port_files[0], 'r') as f:
-                    self.results['ports'] = json.load(f)
-                logger.info(f"Loaded port scan results")
-            except Exception as e:
-                logger.error(f"Error loading port scan results: {e}")
-        
-        # Load directory enumeration results
-        dir_files = glob.glob(f"{self.input_dir}/directories/*.json")
-        if dir_files:
-            try:
-                with open(dir_files[0], 'r') as f:
-                    self.results['directories'] = json.load(f)
-                logger.info(f"Loaded directory enumeration results")
-            except Exception as e:
-                logger.error(f"Error loading directory enumeration results: {e}")
-        
-        # Load live host results
-        host_files = glob.glob(f"{self.input_dir}/livehosts/*.json")
-        if host_files:
-            try:
-                with open(host_files[0], 'r') as f:
-                    self.results['livehosts'] = json.load(f)
-                logger.info(f"Loaded live host results")
-            except Exception as e:
-                logger.error(f"Error loading live host results: {e}")
-        
-        # Load vulnerability scan results
-        vuln_files = glob.glob(f"{self.input_dir}/vulnerabilities/*.json")
-        if vuln_files:
-            for vuln_file in vuln_files:
-                try:
-                    with open(vuln_file, 'r') as f:
-                        if 'vulnerabilities' not in self.results:
-                            self.results['vulnerabilities'] = []
-                        self.results['vulnerabilities'].append(json.load(f))
-                    logger.info(f"Loaded vulnerability results from {vuln_file}")
-                except Exception as e:
-                    logger.error(f"Error loading vulnerability results from {vuln_file}: {e}")
-        
-        # Check if any results were loaded
-        if not self.results:
-            logger.warning("No results were loaded. Make sure the scans have completed.")
-            return False
-        
-        return True
+# Instructions sent ahead of the findings. Keep this text byte-for-byte stable
+# between runs (no timestamps or scan data) so the provider's prompt prefix
+# cache can reuse it; with Anthropic's API the same block would be sent as a
+# system content block marked with cache_control {"type": "ephemeral"}.
+AI_SYSTEM_PROMPT = """You are a senior cybersecurity expert analyzing bug bounty scan results.
+Based on the findings provided, give a comprehensive analysis with detailed remediation steps.
+Focus on actionable recommendations with code examples where appropriate.
 
-    def analyze_results(self):
-        """Analyze the loaded results"""
-        logger.info("Analyzing results")
-        
-        # Initialize analysis structure
-        self.analysis = {
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'summary': {},
-            'details': {}
-        }
-        
-        # Analyze subdomains
-        if 'subdomains' in self.results:
-            subdomains = self.results['subdomains'].get('subdomains', [])
-            self.analysis['summary']['subdomain_count'] = len(subdomains)
-            self.analysis['details']['interesting_subdomains'] = self._find_interesting_subdomains(subdomains)
-        
-        # Analyze ports
-        if 'ports' in self.results:
-            self.analysis['details']['open_ports'] = self._analyze_ports(self.results['ports'])
-            
-            # Count open ports
-            open_port_count = 0
-            for host in self.results['ports'].get('scan_results', []):
-                open_port_count += len(host.get('ports', []))
-            
-            self.analysis['summary']['open_port_count'] = open_port_count
-        
-        # Analyze directories
-        if 'directories' in self.results:
-            dir_scan = self.results['directories'].get('directory_scan', [])
-            self.analysis['summary']['directory_count'] = len(dir_scan)
-            self.analysis['details']['interesting_directories'] = self._find_interesting_directories(dir_scan)
-        
-        # Analyze live hosts
-        if 'livehosts' in self.results:
-            live_hosts = self.results['livehosts'].get('live_hosts', [])
-            self.analysis['summary']['live_host_count'] = len(live_hosts)
-        
-        # Analyze vulnerabilities
-        if 'vulnerabilities' in self.results:
-            self.analysis['details']['vulnerabilities'] = self._analyze_vulnerabilities(self.results['vulnerabilities'])
-            
-            # Count vulnerabilities by severity
-            vuln_count = {
-                'critical': 0,
-                'high': 0,
-                'medium': 0,
-                'low': 0,
-                'info': 0
-            }
-            
-            for vuln in self.analysis['details']['vulnerabilities']:
-                severity = vuln.get('severity', 'info').lower()
-                if severity in vuln_count:
-                    vuln_count[severity] += 1
-                else:
-                    vuln_count['info'] += 1
-            
-            self.analysis['summary']['vulnerability_count'] = vuln_count
-        
-        return True
+Your response should include:
+1. A concise summary of the most critical findings
+2. Detailed remediation steps for each vulnerability, prioritized by severity
+3. Code examples to fix the most critical issues
+4. References to security best practices and standards
+5. A recommended timeline for addressing each category of findings
 
-    def generate_recommendations(self):
-        """Generate recommendations based on the analysis"""
-        logger.info("Generating recommendations")
-        
-        # Initialize recommendations structure
-        self.recommendations = {
-            'high_priority': [],
-            'medium_priority': [],
-            'low_priority': []
-        }
-        
-        # Analyze vulnerabilities for recommendations
-        if 'vulnerabilities' in self.analysis['details']:
-            for vuln in self.analysis['details']['vulnerabilities']:
-                severity = vuln.get('severity', 'info').lower()
-                
-                recommendation = {
-                    'title': vuln.get('title', 'Unnamed vulnerability'),
-                    'description': vuln.get('description', ''),
-                    'recommendation': self._get_recommendation_for_vulnerability(vuln)
-                }
-                
-                if severity in ['critical', 'high']:
-                    self.recommendations['high_priority'].append(recommendation)
-                elif severity == 'medium':
-                    self.recommendations['medium_priority'].append(recommendation)
-                else:
-                    self.recommendations['low_priority'].append(recommendation)
-        
-        # Add recommendations based on open ports
-        if 'open_ports' in self.analysis['details']:
-            for port_info in self.analysis['details']['open_ports']:
-                if port_info['port'] in [22, 23, 3389, 5900]:
-                    self.recommendations['medium_priority'].append({
-                        'title': f"Remote Access Service on Port {port_info['port']}",
-                        'description': f"Found {port_info['service']} running on port {port_info['port']}",
-                        'recommendation': f"Restrict access to port {port_info['port']} to trusted IPs only and ensure strong authentication is in place."
-                    })
-                elif port_info['port'] in [80, 443]:
-                    self.recommendations['low_priority'].append({
-                        'title': f"Web Service on Port {port_info['port']}",
-                        'description': f"Found {port_info['service']} running on port {port_info['port']}",
-                        'recommendation': "Ensure the web server is properly configured with secure headers and up-to-date."
-                    })
-                elif port_info['port'] in [21, 20]:
-                    self.recommendations['medium_priority'].append({
-                        'title': f"FTP Service on Port {port_info['port']}",
-                        'description': f"Found {port_info['service']} running on port {port_info['port']}",
-                        'recommendation': "Consider replacing FTP with SFTP or FTPS for secure file transfers."
-                    })
-        
-        # Add recommendations based on interesting directories
-        if 'interesting_directories' in self.analysis['details']:
-            for dir_info in self.analysis['details']['interesting_directories']:
-                if '.git' in dir_info['url'] or '.env' in dir_info['url']:
-                    self.recommendations['high_priority'].append({
-                        'title': "Sensitive Information Exposure",
-                        'description': f"Found {dir_info['url']} which may expose sensitive information",
-                        'recommendation': f"Remove or restrict access to {dir_info['url']} immediately."
-                    })
-                elif 'wp-admin' in dir_info['url'] or 'admin' in dir_info['url']:
-                    self.recommendations['medium_priority'].append({
-                        'title': "Admin Interface Exposed",
-                        'description': f"Found potential admin interface at {dir_info['url']}",
-                        'recommendation': "Restrict access to admin interfaces and use strong passwords and 2FA."
-                    })
-        
-        return True
+Based on the findings, please also provide:
+1. A concise analysis of the security posture
+2. Prioritized recommendations (immediate, short-term, and long-term)
+3. Any patterns or notable security concerns
+"""
 
-    def prioritize_findings(self):
-        """Prioritize findings based on severity and impact"""
-        logger.info("Prioritizing findings")
-        
-        # Initialize priorities
-        self.priorities = {
-            'immediate_action': [],
-            'short_term': [],
-            'long_term': []
-        }
-        
-        # Prioritize critical and high vulnerabilities for immediate action
-        if 'high_priority' in self.recommendations:
-            for rec in self.recommendations['high_priority']:
-                self.priorities['immediate_action'].append({
-                    'title': rec['title'],
-                    'description': rec['description'],
-                    'recommendation': rec['recommendation'],
-                    'timeframe': 'As soon as possible (24-48 hours)'
-                })
-        
-        # Prioritize medium vulnerabilities for short term
-        if 'medium_priority' in self.recommendations:
-            for rec in self.recommendations['medium_priority']:
-                self.priorities['short_term'].append({
-                    'title': rec['title'],
-                    'description': rec['description'],
-                    'recommendation': rec['recommendation'],
-                    'timeframe': 'Within 1-2 weeks'
-                })
-        
-        # Prioritize low vulnerabilities for long term
-        if 'low_priority' in self.recommendations:
-            for rec in self.recommendations['low_priority']:
-                self.priorities['long_term'].append({
-                    'title': rec['title'],
-                    'description': rec['description'],
-                    'recommendation': rec['recommendation'],
-                    'timeframe': 'Within 1-3 months'
-                })
-        
-        return True
-    
-    def use_ai_for_analysis(self):
-        """Use AI models to enhance the analysis if available"""
-        if not OPENAI_AVAILABLE and not TRANSFORMERS_AVAILABLE:
-            logger.warning("No AI models available for enhanced analysis")
-            return False
-        
-        logger.info("Using AI for enhanced analysis")
-        
-        # Try to use OpenAI first
-        if OPENAI_AVAILABLE:
-            api_key = os.getenv("OPENAI_API_KEY")
-            if api_key:
-                try:
-                    logger.info("Using OpenAI for analysis")
-                    openai.api_key = api_key
-                    
-                    # Prepare a summary of findings for the AI
-                    prompt = self._prepare_ai_prompt()
-                    
-                    # Call OpenAI API
-                    response = openai.Completion.create(
-                        engine="text-davinci-003",
-                        prompt=prompt,
-                        max_tokens=1000,
-                        temperature=0.7
-                    )
-                    
-                    # Extract AI analysis
-                    ai_analysis = response.choices[0].text.strip()
-                    
-                    # Add AI analysis to the results
-                    self.analysis['ai_enhanced'] = {
-                        'model': 'OpenAI text-davinci-003',
-                        'analysis': ai_analysis
-                    }
-                    
-                    logger.info("OpenAI analysis completed")
-                    return True
-                except Exception as e:
-                    logger.error(f"Error using OpenAI: {e}")
-        
-        # Fall back to transformers if OpenAI is not available or failed
-        if TRANSFORMERS_AVAILABLE:
-            try:
-                logger.info("Using HuggingFace transformers for analysis")
-                
-                # Use a summarization model
-                summarizer = pipeline("summarization")
-                
-                # Prepare text to summarize
-                text = self._prepare_transformers_text()
-                
-                # Generate summary
-                if text:
-                    summary = summarizer(text, max_length=250, min_length=50, do_sample=False)
-                    
-                    # Add AI analysis to the results
-                    self.analysis['ai_enhanced'] = {
-                        'model': 'HuggingFace Transformers',
-                        'analysis': summary[0]['summary_text']
-                    }
-                    
-                    logger.info("Transformers analysis completed")
-                    return True
-                else:
-                    logger.warning("Not enough text for transformers to analyze")
-            except Exception as e:
-                logger.error(f"Error using transformers: {e}")
-        
-        return False
+OPENAI_MODEL = os.getenv("BOUNTYX_OPENAI_MODEL", "gpt-4o-mini")
 
-    def save_results(self, target):
-        """Save analysis results to file with comprehensive remediation steps"""
-        output_dir = f"{self.input_dir}/analysis"
-        os.makedirs(output_dir, exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        filename_base = f"{output_dir}/{target}_analysis_{timestamp}"
-        
-        # Create the final output structure with enhanced remediation recommendations
-        final_output = {
-            'target': target,
-            'timestamp': timestamp,
-            'scan_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'summary': self.analysis.get('summary', {}),
-            'details': self.analysis.get('details', {}),
-            'recommendations': self.recommendations,
-            'priorities': self.priorities,
-            'remediation_plan': {
-                'immediate_actions': self._format_remediation_plan(self.priorities.get('immediate_action', [])),
-                'short_term_actions': self._format_remediation_plan(self.priorities.get('short_term', [])),
-                'long_term_actions': self._format_remediation_plan(self.priorities.get('long_term', []))
-            }
-        }
-        
-        # Add AI-enhanced analysis if available
-        if 'ai_enhanced' in self.analysis:
-            final_output['ai_enhanced'] = self.analysis['ai_enhanced']
-        
-        # Save in the requested format
-        if self.output_format == 'json':
-            with open(f"{filename_base}.json", 'w') as f:
-                json.dump(final_output, f, indent=2)
-            logger.info(f"Results saved to {filename_base}.json")
-        elif self.output_format == 'txt':
-            with open(f"{filename_base}.txt", 'w') as f:
-                self._write_text_report(f, final_output)
-            logger.info(f"Results saved to {filename_base}.txt")
-        elif self.output_format == 'html':
-            with open(f"{filename_base}.html", 'w') as f:
-                self._write_html_report(f, final_output)
-            logger.info(f"Results saved to {filename_base}.html")
-        else:
-            logger.error(f"Unsupported output format: {self.output_format}")
-            return False
-        
-        return True
+# How long cached AI responses stay valid, in seconds (0 disables the cache)
+try:
+    AI_CACHE_TTL = int(os.getenv("BOUNTYX_AI_CACHE_TTL", "86400"))
+except ValueError:
+    logger.warning("Invalid BOUNTYX_AI_CACHE_TTL value, using the default of 86400 seconds")
+    AI_CACHE_TTL = 86400
 
-    def _write_text_report(self, file, data):
-        """Write a text format report"""
-        file.write(f"BountyX AI Analysis Report\n")
-        file.write(f"=========================\n\n")
-        file.write(f"Target: {data['target']}\n")
-        file.write(f"Timestamp: {data['timestamp']}\n\n")
-        
-        # Write summary
-        file.write("Summary\n-------\n")
-        summary = data.get('summary', {})
-        if 'subdomain_count' in summary:
-            file.write(f"Subdomains found: {summary['subdomain_count']}\n")
-        if 'live_host_count' in summary:
-            file.write(f"Live hosts found: {summary['live_host_count']}\n")
-        if 'open_port_count' in summary:
-            file.write(f"Open ports found: {summary['open_port_count']}\n")
-        if 'directory_count' in summary:
-            file.write(f"Directories found: {summary['directory_count']}\n")
-        if 'vulnerability_count' in summary:
-            vuln_count = summary['vulnerability_count']
-            file.write(f"Vulnerabilities found:\n")
-            file.write(f"  Critical: {vuln_count.get('critical', 0)}\n")
-            file.write(f"  High: {vuln_count.get('high', 0)}\n")
-            file.write(f"  Medium: {vuln_count.get('medium', 0)}\n")
-            file.write(f"  Low: {vuln_count.get('low', 0)}\n")
-            file.write(f"  Info: {vuln_count.get('info', 0)}\n")
-        file.write("\n")
-        
-        # Write AI-enhanced analysis if available
-        if 'ai_enhanced' in data:
-            file.write("AI-Enhanced Analysis\n-------------------\n")
-            file.write(f"Model: {data['ai_enhanced']['model']}\n\n")
-            file.write(f"{data['ai_enhanced']['analysis']}\n\n")
-        
-        # Write priorities
-        file.write("Priorities\n----------\n")
-        
-        # Immediate actions
-        file.write("Immediate Actions (24-48 hours):\n")
-        for action in data['priorities'].get('immediate_action', []):
-            file.write(f"- {action['title']}\n")
-            file.write(f"  Description: {action['description']}\n")
-            file.write(f"  Recommendation: {action['recommendation']}\n\n")
-        
-        # Short term actions
-        file.write("Short Term Actions (1-2 weeks):\n")
-        for action in data['priorities'].get('short_term', []):
-            file.write(f"- {action['title']}\n")
-            file.write(f"  Description: {action['description']}\n")
-            file.write(f"  Recommendation: {action['recommendation']}\n\n")
-        
-        # Long term actions
-        file.write("Long Term Actions (1-3 months):\n")
-        for action in data['priorities'].get('long_term', []):
-            file.write(f"- {action['title']}\n")
-            file.write(f"  Description: {action['description']}\n")
-            file.write(f"  Recommendation: {action['recommendation']}\n\n")
-        
-        # Write details
-        file.write("Details\n-------\n")
-        
-        # Interesting subdomains
-        if 'interesting_subdomains' in data.get('details', {}):
-            file.write("Interesting Subdomains:\n")
-            for subdomain in data['details']['interesting_subdomains']:
-                file.write(f"- {subdomain}\n")
-            file.write("\n")
-        
-        # Open ports
-        if 'open_ports' in data.get('details', {}):
-            file.write("Open Ports:\n")
-            for port in data['details']['open_ports']:
-                file.write(f"- Port {port['port']}: {port['service']} ({port.get('version', 'unknown')})\n")
-            file.write("\n")
-        
-        # Interesting directories
-        if 'interesting_directories' in data.get('details', {}):
-            file.write("Interesting Directories:\n")
-            for directory in data['details']['interesting_directories']:
-                file.write(f"- {directory['url']} [Status: {directory.get('status', 'unknown')}]\n")
-            file.write("\n")
-        
-        # Vulnerabilities
-        if 'vulnerabilities' in data.get('details', {}):
-            file.write("Vulnerabilities:\n")
-            for vuln in data['details']['vulnerabilities']:
-                file.write(f"- {vuln.get('title', 'Unnamed vulnerability')} [{vuln.get('severity', 'unknown').upper()}]\n")
-                file.write(f"  Description: {vuln.get('description', 'No description')}\n")
-                if 'recommendation' in vuln:
-                    file.write(f"  Recommendation: {vuln['recommendation']}\n")
-                file.write("\n")
+# Prefer orjson for reading and writing JSON when it is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-    def _write_html_report(self, file, data):
-        """Write an HTML format report"""
-        html = """
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>BountyX AI Analysis Report</title>
-            <style>
-                body {
-                    font-family: Arial, sans-serif;
-                    line-height: 1.6;
-                    margin: 0;
-                    padding: 20px;
-                    color: #333;
-                }
-                .container {
-                    max-width: 1200px;
-                    margin: 0 auto;
-                }
-                h1, h2, h3, h4 {
-                    color: #2c3e50;
-                }
-                .header {
-                    background-color: #34495e;
-                    color: white;
-                    padding: 20px;
-                    text-align: center;
-                    margin-bottom: 20px;
-                }
-                .section {
-                    margin-bottom: 30px;
-                    padding: 20px;
-                    background-color: #f9f9f9;
-                    border-radius: 5px;
-                }
-                .subsection {
-                    margin-bottom: 20px;
-                }
-                .vuln-critical, .priority-immediate {
-                    background-color: #f8d7da;
-                    border: 1px solid #f5c6cb;
-                    padding: 10px;
-                    border-radius: 5px;
-                    margin-bottom: 10px;
-                }
-                .vuln-high, .priority-short {
-                    background-color: #fff3cd;
-                    border: 1px solid #ffeeba;
-                    padding: 10px;
-                    border-radius: 5px;
-                    margin-bottom: 10px;
-                }
-                .vuln-medium {
-                    background-color: #d1ecf1;
-                    border: 1px solid #bee5eb;
-                    padding: 10px;
-                    border-radius: 5px;
-                    margin-bottom: 10px;
-                }
-                .vuln-low, .priority-long {
-                    background-color: #d4edda;
-                    border: 1px solid #c3e6cb;
-                    padding: 10px;
-                    border-radius: 5px;
-                    margin-bottom: 10px;
-                }
-                .summary-box {
-                    display: flex;
-                    flex-wrap: wrap;
-                    justify-content: space-between;
-                }
-                .summary-item {
-                    flex: 1;
-                    min-width: 200px;
-                    margin: 10px;
-                    padding: 15px;
-                    background-color: #e9ecef;
-                    border-radius: 5px;
-                    text-align: center;
-                }
-                .summary-item h3 {
-                    margin-top: 0;
-                }
-                table {
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin-bottom: 20px;
-                }
-                th, td {
-                    border: 1px solid #ddd;
-                    padding: 8px;
-                    text-align: left;
-                }
-                th {
-                    background-color: #f2f2f2;
-                }
-                tr:nth-child(even) {
-                    background-color: #f9f9f9;
-                }
-                .ai-section {
-                    background-color: #e6f7ff;
-                    border: 1px solid #91d5ff;
-                    padding: 15px;
-                    border-radius: 5px;
-                    margin-bottom: 20px;
-                }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>BountyX AI Analysis Report</h1>
-                    <p>Target: {target}</p>
-                    <p>Generated: {timestamp}</p>
-                </div>
-        """.format(
-            target=data['target'],
-            timestamp=data['timestamp']
-        )
-        
-        # Add summary section
-        html += """
-                <div class="section">
-                    <h2>Summary</h2>
-                    <div class="summary-box">
-        """
-        
-        summary = data.get('summary', {})
-        
-        if 'subdomain_count' in summary:
-            html += """
-                        <div class="summary-item">
-                            <h3>Subdomains</h3>
-                            <p>{count}</p>
-                        </div>
-            """.format(count=summary['subdomain_count'])
-        
-        if 'live_host_count' in summary:
-            html += """
-                        <div class="summary-item">
-                            <h3>Live Hosts</h3>
-                            <p>{count}</p>
-                        </div>
-            """.format(count=summary['live_host_count'])
-        
-        if 'open_port_count' in summary:
-            html += """
-                        <div class="summary-item">
-                            <h3>Open Ports</h3>
-                            <p>{count}</p>
-                        </div>
-            """.format(count=summary['open_port_count'])
-        
-        if 'directory_count' in summary:
-            html += """
-                        <div class="summary-item">
-                            <h3>Directories</h3>
-                            <p>{count}</p>
-                        </div>
-            """.format(count=summary['directory_count'])
-        
-        if 'vulnerability_count' in summary:
-            vuln_count = summary['vulnerability_count']
-            html += """
-                        <div class="summary-item">
-                            <h3>Vulnerabilities</h3>
-                            <p>Critical: {critical}<br>
-                               High: {high}<br>
-                               Medium: {medium}<br>
-                               Low: {low}<br>
-                               Info: {info}</p>
-                        </div>
-            """.format(
-                critical=vuln_count.get('critical', 0),
-                high=vuln_count.get('high', 0),
-                medium=vuln_count.get('medium', 0),
-                low=vuln_count.get('low', 0),
-                info=vuln_count.get('info', 0)
-            )
-        
-        html += """
-                    </div>
-                </div>
-        """
-        
-        # Add AI-enhanced section if available
-        if 'ai_enhanced' in data:
-            html += """
-                <div class="section ai-section">
-                    <h2>AI-Enhanced Analysis</h2>
-                    <p><strong>Model:</strong> {model}</p>
-                    <p>{analysis}</p>
-                </div>
-            """.format(
-                model=data['ai_enhanced']['model'],
-                analysis=data['ai_enhanced']['analysis'].replace('\n', '<br>')
-            )
-        
-        # Add priorities section
-        html += """
-                <div class="section">
-                    <h2>Action Priorities</h2>
-        """
-        
-        # Immediate actions
-        html += """
-                    <div class="subsection">
-                        <h3>Immediate Actions (24-48 hours)</h3>
-        """
-        
-        for action in data['priorities'].get('immediate_action', []):
-            html += """
-                        <div class="priority-immediate">
-                            <h4>{title}</h4>
-                            <p><strong>Description:</strong> {description}</p>
-                            <p><strong>Recommendation:</strong> {recommendation}</p>
-                        </div>
-            """.format(
-                title=action['title'],
-                description=action['description'],
-                recommendation=action['recommendation']
-            )
-        
-        html += """
-                    </div>
-        """
-        
-        # Short term actions
-        html += """
-                    <div class="subsection">
-                        <h3>Short Term Actions (1-2 weeks)</h3>
-        """
-        
-        for action in data['priorities'].get('short_term', []):
-            html += """
-                        <div class="priority-short">
-                            <h4>{title}</h4>
-                            <p><strong>Description:</strong> {description}</p>
-                            <p><strong>Recommendation:</strong> {recommendation}</p>
-                        </div>
-            """.format(
-                title=action['title'],
-                description=action['description'],
-                recommendation=action['recommendation']
-            )
-        
-        html += """
-                    </div>
-        """
-        
-        # Long term actions
-        html += """
-                    <div class="subsection">
-                        <h3>Long Term Actions (1-3 months)</h3>
-        """
-        
-        for action in data['priorities'].get('long_term', []):
-            html += """
-                        <div class="priority-long">
-                            <h4>{title}</h4>
-                            <p><strong>Description:</strong> {description}</p>
-                            <p><strong>Recommendation:</strong> {recommendation}</p>
-                        </div>
-            """.format(
-                title=action['title'],
-                description=action['description'],
-                recommendation=action['recommendation']
-            )
-        
-        html += """
-                    </div>
-                </div>
-        """
-        
-        # Add details section
-        html += """
-                <div class="section">
-                    <h2>Detailed Findings</h2>
-        """
-        
-        # Interesting subdomains
-        if 'interesting_subdomains' in data.get('details', {}):
-            html += """
-                    <div class="subsection">
-                        <h3>Interesting Subdomains</h3>
-                        <ul>
-            """
-            
-            for subdomain in data['details']['interesting_subdomains']:
-                html += f"<li>{subdomain}</li>"
-            
-            html += """
-                        </ul>
-                    </div>
-            """
-        
-        # Open ports
-        if 'open_ports' in data.get('details', {}):
-            html += """
-                    <div class="subsection">
-                        <h3>Open Ports</h3>
-                        <table>
-                            <tr>
-                                <th>Port</th>
-                                <th>Service</th>
-                                <th>Version</th>
-                            </tr>
-            """
-            
-            for port in data['details']['open_ports']:
-                html += """
-                            <tr>
-                                <td>{port}</td>
-                                <td>{service}</td>
-                                <td>{version}</td>
-                            </tr>
-                """.format(
-                    port=port['port'],
-                    service=port['service'],
-                    version=port.get('version', 'unknown')
-                )
-            
-            html += """
-                        </table>
-                    </div>
-            """
-        
-        # Interesting directories
-        if 'interesting_directories' in data.get('details', {}):
-            html += """
-                    <div class="subsection">
-                        <h3>Interesting Directories</h3>
-                        <table>
-                            <tr>
-                                <th>URL</th>
-                                <th>Status</th>
-                            </tr>
-            """
-            
-            for directory in data['details']['interesting_directories']:
-                html += """
-                            <tr>
-                                <td>{url}</td>
-                                <td>{status}</td>
-                            </tr>
-                """.format(
-                    url=directory['url'],
-                    status=directory.get('status', 'unknown')
-                )
-            
-            html += """
-                        </table>
-                    </div>
-            """
-        
-        # Vulnerabilities
-        if 'vulnerabilities' in data.get('details', {}):
-            html += """
-                    <div class="subsection">
-                        <h3>Vulnerabilities</h3>
-            """
-            
-            for vuln in data['details']['vulnerabilities']:
-                severity = vuln.get('severity', 'info').lower()
-                css_class = f"vuln-{severity}" if severity in ['critical', 'high', 'medium', 'low'] else "vuln-low"
-                
-                html += """
-                        <div class="{css_class}">
-                            <h4>{title} [{severity}]</h4>
-                            <p><strong>Description:</strong> {description}</p>
-                """.format(
-                    css_class=css_class,
-                    title=vuln.get('title', 'Unnamed vulnerability'),
-                    severity=severity.upper(),
-                    description=vuln.get('description', 'No description')
-                )
-                
-                if 'recommendation' in vuln:
-                    html += f"<p><strong>Recommendation:</strong> {vuln['recommendation']}</p>"
-                
-                html += """
-                        </div>
-                """
-            
-            html += """
-                    </div>
-            """
-        
-        html += """
-                </div>
-                <div class="section">
-                    <p>Generated by BountyX AI Helper</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        file.write(html)
+# Parse very large vulnerability files incrementally with ijson when it is installed.
+# It is only imported when such a file turns up.
+IJSON_AVAILABLE = importlib.util.find_spec("ijson") is not None
 
-    def _find_interesting_subdomains(self, subdomains):
-        """Find potentially interesting subdomains"""
-        interesting_keywords = [
-            'admin', 'dev', 'staging', 'test', 'beta', 'api', 'internal',
-            'vpn', 'mail', 'remote', 'portal', 'intranet', 'secure', 'login',
-            'db', 'database', 'auth', 'jenkins', 'git', 'svn', 'jira', 'confluence'
-        ]
-        
-        interesting = []
-        for subdomain in subdomains:
-            for keyword in interesting_keywords:
-                if keyword in subdomain.lower():
-                    interesting.append(subdomain)
-                    break
-        
-        return interesting
+# Files above this size are stream-parsed rather than read into memory whole
+STREAM_PARSE_THRESHOLD = 64 * 1024 * 1024
 
-    def _analyze_ports(self, port_data):
-        """Analyze port scan data"""
-        interesting_ports = []
-        
-        for host in port_data.get('scan_results', []):
-            for port_info in host.get('ports', []):
-                interesting_ports.append({
-                    'host': host.get('host', 'unknown'),
-                    'port': port_info.get('port', 0),
-                    'service': port_info.get('service', 'unknown'),
-                    'version': port_info.get('version', 'unknown')
-                })
-        
-        return interesting_ports
+# Prefer pyahocorasick for matching remediation keys when it is installed
+try:
+    import ahocorasick  # type: ignore
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
-    def _find_interesting_directories(self, directories):
-        """Find potentially interesting directories"""
-        interesting_keywords = [
-            '.git', '.env', 'wp-admin', 'admin', 'backup', 'db', 'config',
-            'dashboard', 'login', 'api', 'test', 'dev', 'staging', 'beta',
-            'phpinfo', 'phpmyadmin', 'jenkins', 'jira', 'confluence',
-            'password', 'credentials', 'sql', 'database'
-        ]
-        
-        interesting = []
-        for directory in directories:
-            url = directory.get('url', '')
-            for keyword in interesting_keywords:
-                if keyword in url.lower():
-                    interesting.append(directory)
-                    break
-        
-        return interesting
+# Prefer jinja2 for rendering HTML reports when it is installed. It is only
+# imported when an HTML report is written.
+JINJA2_AVAILABLE = importlib.util.find_spec("jinja2") is not None
 
-    def _analyze_vulnerabilities(self, vulnerabilities):
-        """Analyze vulnerability data"""
-        analyzed_vulns = []
-        
-        for vuln_data in vulnerabilities:
-            # Handle nuclei format
-            if 'results' in vuln_data:
-                for result in vuln_data['results']:
-                    analyzed_vulns.append({
-                        'title': result.get('info', {}).get('name', 'Unknown Vulnerability'),
-                        'severity': result.get('info', {}).get('severity', 'info'),
-                        'description': result.get('info', {}).get('description', ''),
-                        'url': result.get('host', ''),
-                        'recommendation': self._get_recommendation_for_vulnerability_type(
-                            result.get('info', {}).get('name', ''),
-                            result.get('matcher-name', '')
-                        )
-                    })
-            # Handle manual checks format
-            elif 'manual_checks' in vuln_data:
-                for check in vuln_data['manual_checks']:
-                    title = check.get('title', '')
-                    severity = 'info'
-                    
-                    # Determine severity based on title content
-                    if 'CRITICAL' in title:
-                        severity = 'critical'
-                    elif 'WARNING' in title:
-                        severity = 'medium'
-                    
-                    analyzed_vulns.append({
-                        'title': title,
-                        'severity': severity,
-                        'description': check.get('content', ''),
-                        'recommendation': self._get_recommendation_for_vulnerability_type(title, '')
-                    })
-        
-        return analyzed_vulns
+# Report templates live next to this script, like the wordlists. A mypyc-compiled
+# build only sees its bare file name while importing, so look it up on sys.path
+# (falling back to the working directory if it is not there)
+_MODULE_FILE = __file__
+if not os.path.dirname(_MODULE_FILE):
+    _MODULE_FILE = next(
+        (os.path.join(entry, _MODULE_FILE) for entry in sys.path
+         if os.path.isfile(os.path.join(entry, _MODULE_FILE))),
+        _MODULE_FILE
+    )
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(_MODULE_FILE)), 'templates')
 
-    def _get_recommendation_for_vulnerability(self, vuln):
-        """Generate a detailed recommendation for a specific vulnerability with remediation steps"""
-        vuln_type = vuln.get('title', '').lower()
-        severity = vuln.get('severity', 'medium').lower()
-        
-        # Get the basic recommendation based on vulnerability type
-        recommendation = self._get_recommendation_for_vulnerability_type(vuln_type, '')
-        
-        # Add contextual information from the vulnerability details
-        details = vuln.get('details', {})
-        affected_url = details.get('url', vuln.get('url', ''))
-        
-        # Format the recommendation with specific information
-        formatted_recommendation = {
-            'summary': recommendation['summary'],
-            'steps': recommendation['steps'],
-            'code_example': recommendation['code_example'],
-            'references': recommendation['references']
-        }
-        
-        # Add target-specific information if available
-        if affected_url:
-            formatted_recommendation['affected_url'] = affected_url
-            formatted_recommendation['steps'] = [
-                step.replace('{{URL}}', affected_url) for step in formatted_recommendation['steps']
-            ]
-        
-        # Add severity-based prioritization
-        if severity in ['critical', 'high']:
-            formatted_recommendation['timeframe'] = "Immediate (within 24-48 hours)"
-        elif severity == 'medium':
-            formatted_recommendation['timeframe'] = "Short-term (within 1-2 weeks)"
-        else:
-            formatted_recommendation['timeframe'] = "Medium-term (within 1 month)"
-        
-        return formatted_recommendation
 
-    def _get_recommendation_for_vulnerability_type(self, vuln_name, matcher_name):
-        """Generate a detailed recommendation based on vulnerability type with remediation steps, 
-        code examples, and references"""
-        vuln_name_lower = vuln_name.lower()
-        matcher_name_lower = matcher_name.lower()
-        
-        # Comprehensive vulnerability remediation database
-        remediation_db = {
-            'sql injection': {
-                'summary': "Protect against SQL injection attacks by using parameterized queries and input validation",
-                'steps': [
-                    "Replace dynamic SQL queries with parameterized queries or prepared statements",
-                    "Implement proper input validation and sanitization for all user inputs",
-                    "Apply the principle of least privilege to database accounts",
-                    "Use an ORM (Object-Relational Mapping) library when possible",
-                    "Implement a Web Application Firewall (WAF) as an additional layer of protection"
-                ],
-                'code_example': """
+@lru_cache(maxsize=None)
+def _get_html_head():
+    """Return the static document head shared by every HTML report, read on first use"""
+    with open(os.path.join(TEMPLATES_DIR, 'report_head.html'), encoding='utf-8') as head_file:
+        return head_file.read()
+
+
+@lru_cache(maxsize=None)
+def _get_template_env():
+    """Return the report template environment, built on first use. The template is
+    compiled once per process, and its bytecode is cached on disk (in the system
+    temp directory) so later runs skip compilation too"""
+    import jinja2
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATES_DIR),
+        bytecode_cache=jinja2.FileSystemBytecodeCache(),
+        autoescape=True,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        auto_reload=False
+    )
+
+
+# Static fragments of the plain HTML report, built once at import. They carry no
+# indentation so the generated document holds no padding whitespace.
+_HTML_SUMMARY_OPEN = '<div class="section"><h2>Summary</h2><div class="summary-box">\n'
+_HTML_SECTION_BOX_CLOSE = '</div></div>\n'
+_HTML_PRIORITIES_OPEN = '<div class="section"><h2>Action Priorities</h2>\n'
+_HTML_IMMEDIATE_OPEN = '<div class="subsection"><h3>Immediate Actions (24-48 hours)</h3>\n'
+_HTML_SUBSECTION_CLOSE = '</div>\n'
+_HTML_SHORT_TERM_OPEN = '<div class="subsection"><h3>Short Term Actions (1-2 weeks)</h3>\n'
+_HTML_LONG_TERM_OPEN = '<div class="subsection"><h3>Long Term Actions (1-3 months)</h3>\n'
+_HTML_DETAILS_OPEN = '<div class="section"><h2>Detailed Findings</h2>\n'
+_HTML_SUBDOMAINS_OPEN = '<div class="subsection"><h3>Interesting Subdomains</h3><ul>\n'
+_HTML_LIST_CLOSE = '</ul></div>\n'
+_HTML_PORTS_OPEN = (
+    '<div class="subsection"><h3>Open Ports</h3><table>'
+    '<tr><th>Port</th><th>Service</th><th>Version</th></tr>\n'
+)
+_HTML_TABLE_CLOSE = '</table></div>\n'
+_HTML_DIRECTORIES_OPEN = (
+    '<div class="subsection"><h3>Interesting Directories</h3><table>'
+    '<tr><th>URL</th><th>Status</th></tr>\n'
+)
+_HTML_VULNERABILITIES_OPEN = '<div class="subsection"><h3>Vulnerabilities</h3>\n'
+_HTML_VULNERABILITIES_CLOSE = '</div>\n'
+_HTML_FOOT = (
+    '</div>\n'
+    '<div class="section"><p>Generated by BountyX AI Helper</p></div>\n'
+    '</div>\n</body>\n</html>\n'
+)
+
+# CSS class for each vulnerability severity; anything else renders as low
+_VULN_CSS_CLASSES = {
+    'critical': 'vuln-critical',
+    'high': 'vuln-high',
+    'medium': 'vuln-medium',
+    'low': 'vuln-low'
+}
+
+# Per-thread StringIO reused by the plain HTML writer across reports
+_report_buffers = threading.local()
+
+# Results subdirectories holding a single JSON file, with a label for logging.
+# The subdirectory name doubles as the key in BountyXAI.results.
+RESULT_TYPES = (
+    ('subdomains', 'subdomain'),
+    ('ports', 'port scan'),
+    ('directories', 'directory enumeration'),
+    ('livehosts', 'live host')
+)
+
+# Severity levels reported in the vulnerability summary
+SEVERITY_LEVELS = ('critical', 'high', 'medium', 'low', 'info')
+
+# Recommendation bucket for each vulnerability severity (anything else is low priority)
+_SEVERITY_PRIORITY = {
+    'critical': 'high_priority',
+    'high': 'high_priority',
+    'medium': 'medium_priority'
+}
+
+# Action bucket and timeframe for each recommendation priority
+IMMEDIATE_TIMEFRAME = 'As soon as possible (24-48 hours)'
+SHORT_TERM_TIMEFRAME = 'Within 1-2 weeks'
+LONG_TERM_TIMEFRAME = 'Within 1-3 months'
+
+_PRIORITY_ACTIONS = {
+    'high_priority': ('immediate_action', IMMEDIATE_TIMEFRAME),
+    'medium_priority': ('short_term', SHORT_TERM_TIMEFRAME),
+    'low_priority': ('long_term', LONG_TERM_TIMEFRAME)
+}
+
+# (priority, title, recommendation) for commonly exposed services, keyed by port.
+# The port is substituted into the text here, once, rather than for every finding.
+_PORT_RECOMMENDATIONS = {
+    port: (priority, title.format(port=port), recommendation.format(port=port))
+    for ports, priority, title, recommendation in (
+        ((22, 23, 3389, 5900), 'medium_priority',
+         "Remote Access Service on Port {port}",
+         "Restrict access to port {port} to trusted IPs only and ensure strong authentication is in place."),
+        ((80, 443), 'low_priority',
+         "Web Service on Port {port}",
+         "Ensure the web server is properly configured with secure headers and up-to-date."),
+        ((21, 20), 'medium_priority',
+         "FTP Service on Port {port}",
+         "Consider replacing FTP with SFTP or FTPS for secure file transfers.")
+    )
+    for port in ports
+}
+
+# Keywords that make a subdomain or directory worth a closer look
+INTERESTING_SUBDOMAIN_KEYWORDS = (
+    'admin', 'dev', 'staging', 'test', 'beta', 'api', 'internal',
+    'vpn', 'mail', 'remote', 'portal', 'intranet', 'secure', 'login',
+    'db', 'database', 'auth', 'jenkins', 'git', 'svn', 'jira', 'confluence'
+)
+
+INTERESTING_DIRECTORY_KEYWORDS = (
+    '.git', '.env', 'wp-admin', 'admin', 'backup', 'db', 'config',
+    'dashboard', 'login', 'api', 'test', 'dev', 'staging', 'beta',
+    'phpinfo', 'phpmyadmin', 'jenkins', 'jira', 'confluence',
+    'password', 'credentials', 'sql', 'database'
+)
+
+
+def _compile_keyword_pattern(keywords):
+    """Compile a pattern matching any of the keywords in lowercased text. Callers lowercase
+    the text rather than using (?i), which would disable the engine's literal fast path"""
+    keywords = [keyword.lower() for keyword in keywords]
+    # A keyword containing another keyword can never change the result of search()
+    # ('wp-admin' and 'phpmyadmin' are covered by 'admin'), so leave it out of the alternation
+    keywords = [
+        keyword for keyword in keywords
+        if not any(other != keyword and other in keyword for other in keywords)
+    ]
+    pattern = '|'.join(re.escape(keyword) for keyword in keywords)
+    return re.compile(pattern)
+
+
+_INTERESTING_SUBDOMAIN_PATTERN = _compile_keyword_pattern(INTERESTING_SUBDOMAIN_KEYWORDS)
+_INTERESTING_DIRECTORY_PATTERN = _compile_keyword_pattern(INTERESTING_DIRECTORY_KEYWORDS)
+
+
+def _load_json(path):
+    """Read and parse a JSON file, using orjson when available"""
+    with open(path, 'rb') as f:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(f.read())
+        return json.load(f)
+
+
+def _load_vulnerability_json(path):
+    """Parse a vulnerability results file, streaming it when it is very large"""
+    if not IJSON_AVAILABLE or os.path.getsize(path) <= STREAM_PARSE_THRESHOLD:
+        return _load_json(path)
+    
+    # ijson reads the file in chunks (using its C backend when available), so
+    # the raw text never has to sit in memory next to the parsed records
+    import ijson  # type: ignore
+    with open(path, 'rb') as f:
+        for value in ijson.items(f, '', use_float=True):
+            return value
+    raise ValueError(f"{path} contains no JSON document")
+
+
+# Comprehensive vulnerability remediation database, keyed by the name fragment it covers.
+# Earlier keys take precedence when several match.
+_REMEDIATION_DB: dict = {
+    'sql injection': {
+        'summary': "Protect against SQL injection attacks by using parameterized queries and input validation",
+        'steps': [
+            "Replace dynamic SQL queries with parameterized queries or prepared statements",
+            "Implement proper input validation and sanitization for all user inputs",
+            "Apply the principle of least privilege to database accounts",
+            "Use an ORM (Object-Relational Mapping) library when possible",
+            "Implement a Web Application Firewall (WAF) as an additional layer of protection"
+        ],
+        'code_example': """
 # Example of parameterized query in Python with SQLite:
 import sqlite3
 conn = sqlite3.connect('database.db')
@@ -1055,21 +305,21 @@ cursor = conn.cursor()
 username = request.args.get('username')
 cursor.execute("SELECT * FROM users WHERE username = ?", (username,))
                 """,
-                'references': [
-                    "OWASP SQL Injection Prevention Cheat Sheet: https://cheatsheetseries.owasp.org/cheatsheets/SQL_Injection_Prevention_Cheat_Sheet.html",
-                    "PortSwigger SQL Injection Guide: https://portswigger.net/web-security/sql-injection"
-                ]
-            },
-            'xss': {
-                'summary': "Prevent Cross-Site Scripting (XSS) by implementing proper output encoding and CSP headers",
-                'steps': [
-                    "Implement context-appropriate output encoding for all user-controlled data",
-                    "Use Content-Security-Policy (CSP) headers to restrict script execution",
-                    "Sanitize all user inputs before rendering them in HTML contexts",
-                    "Use modern frameworks that automatically escape output",
-                    "Implement X-XSS-Protection header as an additional defense"
-                ],
-                'code_example': """
+        'references': [
+            "OWASP SQL Injection Prevention Cheat Sheet: https://cheatsheetseries.owasp.org/cheatsheets/SQL_Injection_Prevention_Cheat_Sheet.html",
+            "PortSwigger SQL Injection Guide: https://portswigger.net/web-security/sql-injection"
+        ]
+    },
+    'xss': {
+        'summary': "Prevent Cross-Site Scripting (XSS) by implementing proper output encoding and CSP headers",
+        'steps': [
+            "Implement context-appropriate output encoding for all user-controlled data",
+            "Use Content-Security-Policy (CSP) headers to restrict script execution",
+            "Sanitize all user inputs before rendering them in HTML contexts",
+            "Use modern frameworks that automatically escape output",
+            "Implement X-XSS-Protection header as an additional defense"
+        ],
+        'code_example': """
 # Example of CSP header implementation in Node.js:
 app.use(helmet.contentSecurityPolicy({
   directives: {
@@ -1085,21 +335,21 @@ app.use(helmet.contentSecurityPolicy({
   }
 })
                 """,
-                'references': [
-                    "OWASP XSS Prevention Cheat Sheet: https://cheatsheetseries.owasp.org/cheatsheets/Cross_Site_Scripting_Prevention_Cheat_Sheet.html",
-                    "Content Security Policy (CSP) Quick Reference: https://content-security-policy.com/"
-                ]
-            },
-            'open redirect': {
-                'summary': "Prevent open redirect vulnerabilities by validating destination URLs against a whitelist",
-                'steps': [
-                    "Implement a whitelist of allowed redirect destinations",
-                    "Validate all redirect parameters against this whitelist",
-                    "Use relative path redirects when possible",
-                    "For external redirects, use an intermediate page that requires user confirmation",
-                    "Consider implementing URL signing for sensitive redirects"
-                ],
-                'code_example': """
+        'references': [
+            "OWASP XSS Prevention Cheat Sheet: https://cheatsheetseries.owasp.org/cheatsheets/Cross_Site_Scripting_Prevention_Cheat_Sheet.html",
+            "Content Security Policy (CSP) Quick Reference: https://content-security-policy.com/"
+        ]
+    },
+    'open redirect': {
+        'summary': "Prevent open redirect vulnerabilities by validating destination URLs against a whitelist",
+        'steps': [
+            "Implement a whitelist of allowed redirect destinations",
+            "Validate all redirect parameters against this whitelist",
+            "Use relative path redirects when possible",
+            "For external redirects, use an intermediate page that requires user confirmation",
+            "Consider implementing URL signing for sensitive redirects"
+        ],
+        'code_example': """
 # Example of safe redirect implementation in Python:
 from urllib.parse import urlparse
 import re
@@ -1117,20 +367,20 @@ def safe_redirect(request):
     else:
         return redirect('/')
                 """,
-                'references': [
-                    "OWASP Unvalidated Redirects and Forwards Cheat Sheet: https://cheatsheetseries.owasp.org/cheatsheets/Unvalidated_Redirects_and_Forwards_Cheat_Sheet.html"
-                ]
-            },
-            'csrf': {
-                'summary': "Protect against Cross-Site Request Forgery (CSRF) with anti-CSRF tokens and proper validation",
-                'steps': [
-                    "Implement anti-CSRF tokens for all state-changing operations",
-                    "Ensure tokens are unique per user session and per request",
-                    "Add the 'SameSite=Strict' attribute to cookies",
-                    "Use the 'X-CSRF-TOKEN' header for AJAX requests",
-                    "Consider implementing custom request headers for sensitive operations"
-                ],
-                'code_example': """
+        'references': [
+            "OWASP Unvalidated Redirects and Forwards Cheat Sheet: https://cheatsheetseries.owasp.org/cheatsheets/Unvalidated_Redirects_and_Forwards_Cheat_Sheet.html"
+        ]
+    },
+    'csrf': {
+        'summary': "Protect against Cross-Site Request Forgery (CSRF) with anti-CSRF tokens and proper validation",
+        'steps': [
+            "Implement anti-CSRF tokens for all state-changing operations",
+            "Ensure tokens are unique per user session and per request",
+            "Add the 'SameSite=Strict' attribute to cookies",
+            "Use the 'X-CSRF-TOKEN' header for AJAX requests",
+            "Consider implementing custom request headers for sensitive operations"
+        ],
+        'code_example': """
 # Example of CSRF protection in Flask:
 from flask_wtf.csrf import CSRFProtect
 
@@ -1144,21 +394,21 @@ def process_form():
     # Process form data
     return 'Form processed'
                 """,
-                'references': [
-                    "OWASP CSRF Prevention Cheat Sheet: https://cheatsheetseries.owasp.org/cheatsheets/Cross-Site_Request_Forgery_Prevention_Cheat_Sheet.html",
-                    "SameSite Cookie Attribute: https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Set-Cookie/SameSite"
-                ]
-            },
-            'ssrf': {
-                'summary': "Protect against Server-Side Request Forgery (SSRF) by validating and restricting URLs",
-                'steps': [
-                    "Implement a whitelist of allowed destinations",
-                    "Validate and sanitize all user-provided URLs",
-                    "Use a URL parsing library to canonicalize URLs before validation",
-                    "Block requests to internal networks (127.0.0.0/8, 169.254.0.0/16, etc.)",
-                    "Use network-level protections like firewalls to restrict server connections"
-                ],
-                'code_example': """
+        'references': [
+            "OWASP CSRF Prevention Cheat Sheet: https://cheatsheetseries.owasp.org/cheatsheets/Cross-Site_Request_Forgery_Prevention_Cheat_Sheet.html",
+            "SameSite Cookie Attribute: https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Set-Cookie/SameSite"
+        ]
+    },
+    'ssrf': {
+        'summary': "Protect against Server-Side Request Forgery (SSRF) by validating and restricting URLs",
+        'steps': [
+            "Implement a whitelist of allowed destinations",
+            "Validate and sanitize all user-provided URLs",
+            "Use a URL parsing library to canonicalize URLs before validation",
+            "Block requests to internal networks (127.0.0.0/8, 169.254.0.0/16, etc.)",
+            "Use network-level protections like firewalls to restrict server connections"
+        ],
+        'code_example': """
 # Example of SSRF protection in Python:
 import ipaddress
 from urllib.parse import urlparse
@@ -1188,21 +438,21 @@ def safe_request(url):
     response = requests.get(url)
     return response
                 """,
-                'references': [
-                    "OWASP SSRF Prevention Cheat Sheet: https://cheatsheetseries.owasp.org/cheatsheets/Server_Side_Request_Forgery_Prevention_Cheat_Sheet.html",
-                    "PortSwigger SSRF Guide: https://portswigger.net/web-security/ssrf"
-                ]
-            },
-            'lfi': {
-                'summary': "Protect against Local File Inclusion (LFI) by restricting file access and validating paths",
-                'steps': [
-                    "Implement strict input validation for file paths",
-                    "Use a whitelist of allowed files or directories",
-                    "Avoid using user input directly in file operations",
-                    "Implement proper file access controls",
-                    "Consider using a file abstraction layer instead of direct file system access"
-                ],
-                'code_example': """
+        'references': [
+            "OWASP SSRF Prevention Cheat Sheet: https://cheatsheetseries.owasp.org/cheatsheets/Server_Side_Request_Forgery_Prevention_Cheat_Sheet.html",
+            "PortSwigger SSRF Guide: https://portswigger.net/web-security/ssrf"
+        ]
+    },
+    'lfi': {
+        'summary': "Protect against Local File Inclusion (LFI) by restricting file access and validating paths",
+        'steps': [
+            "Implement strict input validation for file paths",
+            "Use a whitelist of allowed files or directories",
+            "Avoid using user input directly in file operations",
+            "Implement proper file access controls",
+            "Consider using a file abstraction layer instead of direct file system access"
+        ],
+        'code_example': """
 # Example of safe file inclusion in PHP:
 function safeInclude($file) {
     // Define the base directory for includes
@@ -1229,20 +479,20 @@ if (!safeInclude($file)) {
     include('error.php');
 }
                 """,
-                'references': [
-                    "OWASP File Inclusion Guide: https://owasp.org/www-project-web-security-testing-guide/latest/4-Web_Application_Security_Testing/07-Input_Validation_Testing/11.1-Testing_for_Local_File_Inclusion"
-                ]
-            },
-            'rfi': {
-                'summary': "Protect against Remote File Inclusion (RFI) by disabling remote includes and validating sources",
-                'steps': [
-                    "Disable remote file includes if not needed (allow_url_include=Off in PHP)",
-                    "Implement a whitelist of allowed external resources",
-                    "Validate all URLs against the whitelist",
-                    "Use content verification for included files",
-                    "Consider alternatives to dynamic file inclusion"
-                ],
-                'code_example': """
+        'references': [
+            "OWASP File Inclusion Guide: https://owasp.org/www-project-web-security-testing-guide/latest/4-Web_Application_Security_Testing/07-Input_Validation_Testing/11.1-Testing_for_Local_File_Inclusion"
+        ]
+    },
+    'rfi': {
+        'summary': "Protect against Remote File Inclusion (RFI) by disabling remote includes and validating sources",
+        'steps': [
+            "Disable remote file includes if not needed (allow_url_include=Off in PHP)",
+            "Implement a whitelist of allowed external resources",
+            "Validate all URLs against the whitelist",
+            "Use content verification for included files",
+            "Consider alternatives to dynamic file inclusion"
+        ],
+        'code_example': """
 # PHP configuration changes in php.ini:
 allow_url_fopen = Off
 allow_url_include = Off
@@ -1277,20 +527,20 @@ function safeIncludeRemote($url) {
     return false;
 }
                 """,
-                'references': [
-                    "OWASP Remote File Inclusion Guide: https://owasp.org/www-project-web-security-testing-guide/latest/4-Web_Application_Security_Testing/07-Input_Validation_Testing/11.2-Testing_for_Remote_File_Inclusion"
-                ]
-            },
-            'cve': {
-                'summary': "Address known Common Vulnerabilities and Exposures (CVEs) by applying patches and updates",
-                'steps': [
-                    "Identify the specific CVE affecting your software",
-                    "Update the affected software to the latest patched version",
-                    "If patches are not available, implement temporary mitigations as recommended by the vendor",
-                    "Set up a vulnerability management process to track and prioritize patching",
-                    "Consider using a Web Application Firewall (WAF) to block exploitation attempts"
-                ],
-                'code_example': """
+        'references': [
+            "OWASP Remote File Inclusion Guide: https://owasp.org/www-project-web-security-testing-guide/latest/4-Web_Application_Security_Testing/07-Input_Validation_Testing/11.2-Testing_for_Remote_File_Inclusion"
+        ]
+    },
+    'cve': {
+        'summary': "Address known Common Vulnerabilities and Exposures (CVEs) by applying patches and updates",
+        'steps': [
+            "Identify the specific CVE affecting your software",
+            "Update the affected software to the latest patched version",
+            "If patches are not available, implement temporary mitigations as recommended by the vendor",
+            "Set up a vulnerability management process to track and prioritize patching",
+            "Consider using a Web Application Firewall (WAF) to block exploitation attempts"
+        ],
+        'code_example': """
 # Example of security patching process:
 1. Set up automated vulnerability scanning:
    - Use tools like OWASP Dependency Check, Snyk, or GitHub Dependency Graph
@@ -1311,21 +561,21 @@ function safeIncludeRemote($url) {
    echo "Security update applied on $(date)" >> /var/log/security-updates.log
    ```
                 """,
-                'references': [
-                    "National Vulnerability Database: https://nvd.nist.gov/",
-                    "OWASP Dependency Check: https://owasp.org/www-project-dependency-check/"
-                ]
-            },
-            'outdated': {
-                'summary': "Fix outdated software vulnerabilities by updating components and implementing security patches",
-                'steps': [
-                    "Inventory all software components and dependencies",
-                    "Update to the latest stable and secure versions",
-                    "Set up automated dependency checking",
-                    "Implement a regular update schedule and policy",
-                    "Consider containerization to isolate components and simplify updates"
-                ],
-                'code_example': """
+        'references': [
+            "National Vulnerability Database: https://nvd.nist.gov/",
+            "OWASP Dependency Check: https://owasp.org/www-project-dependency-check/"
+        ]
+    },
+    'outdated': {
+        'summary': "Fix outdated software vulnerabilities by updating components and implementing security patches",
+        'steps': [
+            "Inventory all software components and dependencies",
+            "Update to the latest stable and secure versions",
+            "Set up automated dependency checking",
+            "Implement a regular update schedule and policy",
+            "Consider containerization to isolate components and simplify updates"
+        ],
+        'code_example': """
 # Example of automated dependency updates in Node.js:
 # package.json
 {
@@ -1360,21 +610,21 @@ jobs:
           title: 'Dependency Updates'
           branch: 'automated-updates'
                 """,
-                'references': [
-                    "OWASP Top 10 - A9:2017 Using Components with Known Vulnerabilities: https://owasp.org/www-project-top-ten/2017/A9_2017-Using_Components_with_Known_Vulnerabilities",
-                    "Snyk - Dependency Vulnerability Scanner: https://snyk.io/"
-                ]
-            },
-            'missing header': {
-                'summary': "Implement security headers to improve web application defense against common attacks",
-                'steps': [
-                    "Implement Content-Security-Policy (CSP) header",
-                    "Add X-XSS-Protection header",
-                    "Set X-Content-Type-Options: nosniff header",
-                    "Configure Strict-Transport-Security (HSTS) header",
-                    "Add X-Frame-Options header to prevent clickjacking"
-                ],
-                'code_example': """
+        'references': [
+            "OWASP Top 10 - A9:2017 Using Components with Known Vulnerabilities: https://owasp.org/www-project-top-ten/2017/A9_2017-Using_Components_with_Known_Vulnerabilities",
+            "Snyk - Dependency Vulnerability Scanner: https://snyk.io/"
+        ]
+    },
+    'missing header': {
+        'summary': "Implement security headers to improve web application defense against common attacks",
+        'steps': [
+            "Implement Content-Security-Policy (CSP) header",
+            "Add X-XSS-Protection header",
+            "Set X-Content-Type-Options: nosniff header",
+            "Configure Strict-Transport-Security (HSTS) header",
+            "Add X-Frame-Options header to prevent clickjacking"
+        ],
+        'code_example': """
 # Example security headers in Nginx:
 server {
     listen 443 ssl;
@@ -1391,393 +641,1249 @@ server {
     # Other server configuration...
 }
 
-# Example security headers in Express.js:
-const helmet = require('helmet');
-app.use(helmet());
-                """,
-                'references': [
-                    "OWASP Secure Headers Project: https://owasp.org/www-project-secure-headers/",
-                    "Mozilla Observatory: https://observatory.mozilla.org/"
-                ]
-            },
-            'information disclosure': {
-                'summary': "Prevent sensitive information disclosure by controlling error messages and removing debugging info",
-                'steps': [
-                    "Configure custom error pages to avoid revealing system information",
-                    "Remove version information from HTTP headers",
-                    "Disable directory listings on web servers",
-                    "Implement proper exception handling to avoid stack traces in responses",
-                    "Remove comments containing sensitive information from client-side code"
-                ],
-                'code_example': """
-# Example of custom error handling in Express.js:
-app.use((err, req, res, next) => {
-  // Log the error internally
-  console.error(err);
-  
-  // Return a generic error message to the client
-  res.status(500).json({
-    status: 'error',
-    message: 'An internal server error occurred'
-  });
-});
+# Example security headers in Express.js:
+const helmet = require('helmet');
+app.use(helmet());
+                """,
+        'references': [
+            "OWASP Secure Headers Project: https://owasp.org/www-project-secure-headers/",
+            "Mozilla Observatory: https://observatory.mozilla.org/"
+        ]
+    },
+    'information disclosure': {
+        'summary': "Prevent sensitive information disclosure by controlling error messages and removing debugging info",
+        'steps': [
+            "Configure custom error pages to avoid revealing system information",
+            "Remove version information from HTTP headers",
+            "Disable directory listings on web servers",
+            "Implement proper exception handling to avoid stack traces in responses",
+            "Remove comments containing sensitive information from client-side code"
+        ],
+        'code_example': """
+# Example of custom error handling in Express.js:
+app.use((err, req, res, next) => {
+  // Log the error internally
+  console.error(err);
+  
+  // Return a generic error message to the client
+  res.status(500).json({
+    status: 'error',
+    message: 'An internal server error occurred'
+  });
+});
+
+# Example of properly redacting sensitive information in logs:
+function logSanitizer(logObject) {
+  const sensitiveFields = ['password', 'token', 'ssn', 'creditCard', 'secret'];
+  
+  return Object.keys(logObject).reduce((acc, key) => {
+    if (sensitiveFields.includes(key.toLowerCase())) {
+      acc[key] = '[REDACTED]';
+    } else {
+      acc[key] = logObject[key];
+    }
+    return acc;
+  }, {});
+}
+                """,
+        'references': [
+            "OWASP Information Leakage Guide: https://owasp.org/www-project-web-security-testing-guide/latest/4-Web_Application_Security_Testing/01-Information_Gathering/07-Map_Application_Architecture"
+        ]
+    },
+    'directory listing': {
+        'summary': "Disable directory listing to prevent unauthorized browsing of server directories",
+        'steps': [
+            "Disable directory listing in web server configuration",
+            "Create index files in all directories that need to be accessed",
+            "Configure a custom 403 Forbidden page",
+            "Use access controls to restrict directory access",
+            "Regularly audit accessible directories"
+        ],
+        'code_example': """
+# Apache configuration (.htaccess):
+Options -Indexes
+ErrorDocument 403 /error/forbidden.html
+
+# Nginx configuration:
+server {
+    # ...
+    
+    # Disable directory listing
+    autoindex off;
+    
+    # Custom error page
+    error_page 403 /error/forbidden.html;
+    
+    # ...
+}
+                """,
+        'references': [
+            "OWASP Testing for Directory Traversal: https://owasp.org/www-project-web-security-testing-guide/latest/4-Web_Application_Security_Testing/05-Authorization_Testing/01-Testing_Directory_Traversal_File_Include"
+        ]
+    },
+    'default credentials': {
+        'summary': "Eliminate default credential vulnerabilities by changing passwords and implementing proper authentication",
+        'steps': [
+            "Change all default credentials on all systems and components",
+            "Implement a strong password policy for all accounts",
+            "Set up multi-factor authentication (MFA) where possible",
+            "Audit system accounts regularly",
+            "Implement password rotation for service accounts"
+        ],
+        'code_example': """
+# Example of strong password policy implementation in Node.js:
+const passwordValidator = require('password-validator');
+
+// Create a password schema
+const passwordSchema = new passwordValidator();
+passwordSchema
+  .is().min(12)                                   // Minimum length 12
+  .is().max(100)                                  // Maximum length 100
+  .has().uppercase()                              // Must have uppercase letters
+  .has().lowercase()                              // Must have lowercase letters
+  .has().digits(2)                                // Must have at least 2 digits
+  .has().not().spaces()                           // Should not have spaces
+  .has().symbols(1)                               // Must have at least 1 symbol
+  .is().not().oneOf(['Password123!', 'Admin123!']); // Blacklist common passwords
+
+// Validate a password
+function validatePassword(password) {
+  return passwordSchema.validate(password, { list: true });
+}
+                """,
+        'references': [
+            "OWASP Authentication Best Practices: https://cheatsheetseries.owasp.org/cheatsheets/Authentication_Cheat_Sheet.html",
+            "NIST Password Guidelines: https://pages.nist.gov/800-63-3/sp800-63b.html"
+        ]
+    },
+    'sensitive file': {
+        'summary': "Protect sensitive files by removing them from publicly accessible locations and implementing access controls",
+        'steps': [
+            "Remove sensitive files from web-accessible directories",
+            "Move configuration files outside the web root",
+            "Use environment variables for sensitive configuration",
+            "Implement proper file permissions",
+            "Use .gitignore to prevent committing sensitive files"
+        ],
+        'code_example': """
+# Example .gitignore file:
+# Ignore sensitive files
+.env
+.env.*
+config/secrets.yml
+credentials.json
+private_key.pem
+*.key
+*.p12
+*.pfx
+*.password
+
+# Example of using environment variables instead of config files:
+# Instead of:
+# database.json
+{
+  "host": "db.example.com",
+  "username": "admin",
+  "password": "super-secret-password"
+}
+
+# Use environment variables:
+const dbConfig = {
+  host: process.env.DB_HOST,
+  username: process.env.DB_USER,
+  password: process.env.DB_PASSWORD
+};
+                """,
+        'references': [
+            "OWASP Sensitive Data Exposure: https://owasp.org/www-project-top-ten/2017/A3_2017-Sensitive_Data_Exposure",
+            "The Twelve-Factor App - Config: https://12factor.net/config"
+        ]
+    },
+    'ssl tls': {
+        'summary': "Fix SSL/TLS vulnerabilities by configuring proper protocols, cipher suites, and certificates",
+        'steps': [
+            "Disable outdated protocols (SSL 2.0, SSL 3.0, TLS 1.0, TLS 1.1)",
+            "Enable only strong cipher suites",
+            "Configure proper certificate validation",
+            "Implement HTTP Strict Transport Security (HSTS)",
+            "Use secure flag for cookies"
+        ],
+        'code_example': """
+# Nginx secure TLS configuration:
+server {
+    listen 443 ssl;
+    server_name example.com;
+    
+    # TLS configuration
+    ssl_protocols TLSv1.2 TLSv1.3;
+    ssl_prefer_server_ciphers on;
+    ssl_ciphers 'ECDHE-ECDSA-AES256-GCM-SHA384:ECDHE-RSA-AES256-GCM-SHA384:ECDHE-ECDSA-CHACHA20-POLY1305:ECDHE-RSA-CHACHA20-POLY1305:ECDHE-ECDSA-AES128-GCM-SHA256:ECDHE-RSA-AES128-GCM-SHA256';
+    ssl_session_timeout 1d;
+    ssl_session_cache shared:SSL:50m;
+    ssl_session_tickets off;
+    ssl_certificate /path/to/fullchain.pem;
+    ssl_certificate_key /path/to/privkey.pem;
+    
+    # HSTS
+    add_header Strict-Transport-Security "max-age=63072000; includeSubDomains; preload" always;
+    
+    # ...
+}
+                """,
+        'references': [
+            "Mozilla SSL Configuration Generator: https://ssl-config.mozilla.org/",
+            "OWASP Transport Layer Protection Cheat Sheet: https://cheatsheetseries.owasp.org/cheatsheets/Transport_Layer_Protection_Cheat_Sheet.html"
+        ]
+    },
+    'cors': {
+        'summary': "Configure proper Cross-Origin Resource Sharing (CORS) policies to prevent unauthorized access",
+        'steps': [
+            "Specify the exact origins that should be allowed access",
+            "Limit the HTTP methods allowed for cross-origin requests",
+            "Restrict which HTTP headers can be used",
+            "Control whether credentials can be included in cross-origin requests",
+            "Set appropriate caching directives for preflight responses"
+        ],
+        'code_example': """
+# Example of secure CORS configuration in Express.js:
+const cors = require('cors');
+
+// Basic CORS configuration
+app.use(cors({
+  origin: ['https://example.com', 'https://www.example.com'],
+  methods: ['GET', 'POST'],
+  allowedHeaders: ['Content-Type', 'Authorization'],
+  credentials: true,
+  maxAge: 600 // Cache preflight requests for 10 minutes
+}));
+
+# Example of CORS configuration in Nginx:
+location /api/ {
+  if ($request_method = 'OPTIONS') {
+    add_header 'Access-Control-Allow-Origin' 'https://example.com';
+    add_header 'Access-Control-Allow-Methods' 'GET, POST, OPTIONS';
+    add_header 'Access-Control-Allow-Headers' 'DNT,User-Agent,X-Requested-With,If-Modified-Since,Cache-Control,Content-Type,Range,Authorization';
+    add_header 'Access-Control-Max-Age' '600';
+    add_header 'Content-Type' 'text/plain; charset=utf-8';
+    add_header 'Content-Length' '0';
+    return 204;
+  }
+  
+  add_header 'Access-Control-Allow-Origin' 'https://example.com';
+  add_header 'Access-Control-Allow-Methods' 'GET, POST, OPTIONS';
+  add_header 'Access-Control-Allow-Headers' 'DNT,User-Agent,X-Requested-With,If-Modified-Since,Cache-Control,Content-Type,Range,Authorization';
+  add_header 'Access-Control-Expose-Headers' 'Content-Length,Content-Range';
+  
+  # Pass to backend
+  proxy_pass http://backend;
+}
+                """,
+        'references': [
+            "OWASP CORS Guide: https://cheatsheetseries.owasp.org/cheatsheets/Cross-Origin_Resource_Sharing_Cheat_Sheet.html",
+            "MDN CORS: https://developer.mozilla.org/en-US/docs/Web/HTTP/CORS"
+        ]
+    }
+}
+
+# Generic remediation used when no key matches
+_DEFAULT_REMEDIATION: dict = {
+    'summary': "Review and fix this vulnerability based on security best practices",
+    'steps': [
+        "Identify the root cause of the vulnerability",
+        "Research OWASP guidelines for this type of issue",
+        "Apply security patches or updates if available",
+        "Implement appropriate input validation and output encoding",
+        "Consider adding additional security controls"
+    ],
+    'code_example': """
+# General security best practices:
+1. Apply input validation
+2. Use parameterized queries
+3. Implement output encoding
+4. Follow the principle of least privilege
+5. Keep all software updated
+            """,
+    'references': [
+        "OWASP Top 10: https://owasp.org/www-project-top-ten/",
+        "SANS CWE Top 25: https://www.sans.org/top25-software-errors/"
+    ]
+}
+
+# Strip the source indentation and blank padding from the code examples once at load
+# time, and intern the summaries that are shared by every finding of a type
+for _remediation in (*_REMEDIATION_DB.values(), _DEFAULT_REMEDIATION):
+    _remediation['summary'] = sys.intern(_remediation['summary'])
+    _remediation['code_example'] = textwrap.dedent(_remediation['code_example']).strip('\n')
+del _remediation
+
+# Each remediation key mapped to its position in the database and its entry. When
+# several keys match, the one with the lowest position wins, as in an ordered scan.
+_REMEDIATION_ENTRIES = {
+    vuln_type: (index, recommendation)
+    for index, (vuln_type, recommendation) in enumerate(_REMEDIATION_DB.items())
+}
+
+# First word of each remediation key mapped to the key's entry, used when no key
+# matches in full. The earliest key wins a shared word.
+_REMEDIATION_FIRST_WORDS: dict = {}
+for _vuln_type, _entry in _REMEDIATION_ENTRIES.items():
+    _REMEDIATION_FIRST_WORDS.setdefault(_vuln_type.split()[0], _entry)
+
+# Splits a name into the words a \b...\b search would see
+_WORD_PATTERN = re.compile(r'\w+')
+
+# Single-pass matchers over all remediation keys. The automaton holds the full keys and
+# the first words together, ranked so that any full key beats any first word; first
+# words carry their length so a hit can be checked for word boundaries. The regex
+# fallback uses a lookahead so every start position is tried, and its alternatives are
+# in database order, so a key can only be shadowed by one that would win anyway.
+if AHOCORASICK_AVAILABLE:
+    _REMEDIATION_AUTOMATON = ahocorasick.Automaton()
+    for _vuln_type, (_index, _recommendation) in _REMEDIATION_ENTRIES.items():
+        _REMEDIATION_AUTOMATON.add_word(_vuln_type, ((0, _index), 0, _recommendation))
+    for _word, (_index, _recommendation) in _REMEDIATION_FIRST_WORDS.items():
+        # A one-word key already matches in full wherever its word does
+        if _word not in _REMEDIATION_ENTRIES:
+            _REMEDIATION_AUTOMATON.add_word(_word, ((1, _index), len(_word), _recommendation))
+    _REMEDIATION_AUTOMATON.make_automaton()
+else:
+    _REMEDIATION_KEY_PATTERN = re.compile(
+        '(?=(' + '|'.join(re.escape(vuln_type) for vuln_type in _REMEDIATION_DB) + '))'
+    )
+
+
+@lru_cache(maxsize=1024)
+def _lookup_remediation(vuln_name_lower: str, matcher_name_lower: str) -> dict:
+    """Find the remediation entry for lowercased vulnerability and matcher names.
+    Callers must not mutate the returned dict, it is shared between calls"""
+    # Search both names at once. No key contains NUL, so none can match across the
+    # separator, and NUL is not a word character, so word boundaries are kept
+    text = vuln_name_lower + '\x00' + matcher_name_lower
+    
+    # One walk finds both full and partial matches; keep the best ranked
+    if AHOCORASICK_AVAILABLE:
+        best_rank, best = None, _DEFAULT_REMEDIATION
+        for end, (rank, word_length, recommendation) in _REMEDIATION_AUTOMATON.iter(text):
+            if best_rank is not None and rank >= best_rank:
+                continue
+            # First words only count on whole-word boundaries
+            if word_length:
+                start = end - word_length + 1
+                if (start and _WORD_PATTERN.match(text, start - 1)) or _WORD_PATTERN.match(text, end + 1):
+                    continue
+            best_rank, best = rank, recommendation
+        return best
+    
+    # Otherwise look for a full key match first
+    matches = [_REMEDIATION_ENTRIES[vuln_type] for vuln_type in _REMEDIATION_KEY_PATTERN.findall(text)]
+    if matches:
+        return min(matches, key=lambda entry: entry[0])[1]
+    
+    # Check for partial matches on whole words
+    matches = [
+        _REMEDIATION_FIRST_WORDS[word]
+        for word in _WORD_PATTERN.findall(text)
+        if word in _REMEDIATION_FIRST_WORDS
+    ]
+    if matches:
+        return min(matches, key=lambda entry: entry[0])[1]
+    
+    # Default generic recommendation if no specific match is found
+    return _DEFAULT_REMEDIATION
+
+
+class BountyXAI:
+    __slots__ = (
+        'input_dir', 'output_format', 'results', 'analysis', 'recommendations',
+        'priorities', '_summarizer', '_vulnerability_recommendations', '_vulns_by_severity'
+    )
+
+    # Output directories already created by any instance in this process
+    _created_dirs: ClassVar[set] = set()
+
+    def __init__(self, input_dir, output_format="json"):
+        self.input_dir = input_dir
+        self.output_format = output_format
+        self.results = {}
+        self.analysis = {}
+        self.recommendations = {}
+        self.priorities = {}
+        self._summarizer = None
+        self._vulnerability_recommendations = []
+        self._vulns_by_severity = {}
+
+    def load_results(self):
+        """Load all results from the results directory"""
+        logger.info(f"Loading results from {self.input_dir}")
+        
+        # Collect the JSON files of every results subdirectory in one pass
+        result_files = self._scan_results()
+        
+        # Load the single-file results (subdomains, ports, directories, live hosts)
+        for subdir, label in RESULT_TYPES:
+            paths = result_files.get(subdir)
+            if paths:
+                try:
+                    self.results[subdir] = _load_json(paths[0])
+                    logger.info(f"Loaded {label} results from {paths[0]}")
+                except Exception as e:
+                    logger.error(f"Error loading {label} results: {e}")
+        
+        # Load vulnerability scan results
+        vuln_files = result_files.get('vulnerabilities')
+        if vuln_files:
+            # Read the files concurrently but keep their original order
+            with ThreadPoolExecutor(max_workers=min(32, len(vuln_files))) as executor:
+                futures = [(vuln_file, executor.submit(_load_vulnerability_json, vuln_file)) for vuln_file in vuln_files]
+                for vuln_file, future in futures:
+                    try:
+                        vuln_data = future.result()
+                        if 'vulnerabilities' not in self.results:
+                            self.results['vulnerabilities'] = []
+                        self.results['vulnerabilities'].append(vuln_data)
+                        logger.info(f"Loaded vulnerability results from {vuln_file}")
+                    except Exception as e:
+                        logger.error(f"Error loading vulnerability results from {vuln_file}: {e}")
+        
+        # Check if any results were loaded
+        if not self.results:
+            logger.warning("No results were loaded. Make sure the scans have completed.")
+            return False
+        
+        return True
+
+    def _scan_results(self):
+        """Map each results subdirectory name to the JSON files it contains"""
+        result_files = {}
+        try:
+            with os.scandir(self.input_dir) as entries:
+                for sub in entries:
+                    if not sub.is_dir():
+                        continue
+                    with os.scandir(sub.path) as files:
+                        result_files[sub.name] = [
+                            f.path for f in files
+                            if f.name.endswith('.json') and not f.name.startswith('.')
+                        ]
+        except OSError as e:
+            logger.error(f"Error reading results directory {self.input_dir}: {e}")
+        
+        return result_files
+
+    def analyze_results(self):
+        """Analyze the loaded results"""
+        logger.info("Analyzing results")
+        
+        # Initialize analysis structure
+        self.analysis = {
+            'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'summary': {},
+            'details': {}
+        }
+        self._vulnerability_recommendations = []
+        # Analyzed vulnerabilities grouped by lowercased severity, in scan order
+        self._vulns_by_severity = {}
+        
+        # Analyze subdomains
+        if 'subdomains' in self.results:
+            subdomains = self.results['subdomains'].get('subdomains', [])
+            self.analysis['summary']['subdomain_count'] = len(subdomains)
+            self.analysis['details']['interesting_subdomains'] = self._find_interesting_subdomains(subdomains)
+        
+        # Analyze ports
+        if 'ports' in self.results:
+            self.analysis['details']['open_ports'] = self._analyze_ports(self.results['ports'])
+            
+            # Count open ports
+            open_port_count = 0
+            for host in self.results['ports'].get('scan_results', []):
+                open_port_count += len(host.get('ports', []))
+            
+            self.analysis['summary']['open_port_count'] = open_port_count
+        
+        # Analyze directories
+        if 'directories' in self.results:
+            dir_scan = self.results['directories'].get('directory_scan', [])
+            self.analysis['summary']['directory_count'] = len(dir_scan)
+            self.analysis['details']['interesting_directories'] = self._find_interesting_directories(dir_scan)
+        
+        # Analyze live hosts
+        if 'livehosts' in self.results:
+            live_hosts = self.results['livehosts'].get('live_hosts', [])
+            self.analysis['summary']['live_host_count'] = len(live_hosts)
+        
+        # Analyze vulnerabilities
+        if 'vulnerabilities' in self.results:
+            # Normalise, count and prepare recommendations for each vulnerability in one pass
+            vulnerabilities = []
+            counts = Counter()
+            for vuln, title_lower in self._iter_analyzed_vulnerabilities(self.results['vulnerabilities']):
+                vulnerabilities.append(vuln)
+                self._process_vulnerability(vuln, title_lower, counts)
+            
+            self.analysis['details']['vulnerabilities'] = vulnerabilities
+            
+            # Treat unknown severities as info
+            vuln_count = {severity: counts.pop(severity, 0) for severity in SEVERITY_LEVELS}
+            vuln_count['info'] += sum(counts.values())
+            
+            self.analysis['summary']['vulnerability_count'] = vuln_count
+        
+        return True
+
+    def _process_vulnerability(self, vuln, title_lower, counts):
+        """Count a vulnerability's severity and prepare its recommendation"""
+        severity = (vuln.get('severity') or 'info').lower()
+        counts[severity] += 1
+        self._vulns_by_severity.setdefault(severity, []).append(vuln)
+        
+        self._vulnerability_recommendations.append((
+            _SEVERITY_PRIORITY.get(severity, 'low_priority'),
+            {
+                'title': vuln.get('title', 'Unnamed vulnerability'),
+                'description': vuln.get('description', ''),
+                'recommendation': self._get_recommendation_for_vulnerability(vuln, title_lower, severity)
+            }
+        ))
+
+    def generate_recommendations(self):
+        """Generate recommendations based on the analysis"""
+        logger.info("Generating recommendations")
+        
+        # Initialize recommendations and priorities, which are filled together
+        self.recommendations = {
+            'high_priority': [],
+            'medium_priority': [],
+            'low_priority': []
+        }
+        self.priorities = {
+            'immediate_action': [],
+            'short_term': [],
+            'long_term': []
+        }
+        
+        # Vulnerability recommendations were prepared by analyze_results
+        for priority, recommendation in self._vulnerability_recommendations:
+            self._add_recommendation(priority, recommendation)
+        
+        # Add recommendations based on open ports
+        if 'open_ports' in self.analysis['details']:
+            for port_info in self.analysis['details']['open_ports']:
+                port_rec = _PORT_RECOMMENDATIONS.get(port_info['port'])
+                if port_rec:
+                    priority, title, recommendation = port_rec
+                    self._add_recommendation(priority, {
+                        'title': title,
+                        'description': f"Found {port_info['service']} running on port {port_info['port']}",
+                        'recommendation': recommendation
+                    })
+        
+        # Add recommendations based on interesting directories
+        if 'interesting_directories' in self.analysis['details']:
+            for dir_info in self.analysis['details']['interesting_directories']:
+                url = dir_info['url']
+                
+                # Sensitive files take precedence over admin interfaces
+                if '.git' in url or '.env' in url:
+                    self._add_recommendation('high_priority', {
+                        'title': "Sensitive Information Exposure",
+                        'description': f"Found {dir_info['url']} which may expose sensitive information",
+                        'recommendation': f"Remove or restrict access to {dir_info['url']} immediately."
+                    })
+                elif 'admin' in url:  # also covers 'wp-admin'
+                    self._add_recommendation('medium_priority', {
+                        'title': "Admin Interface Exposed",
+                        'description': f"Found potential admin interface at {dir_info['url']}",
+                        'recommendation': "Restrict access to admin interfaces and use strong passwords and 2FA."
+                    })
+        
+        return True
+
+    def _add_recommendation(self, priority, rec):
+        """File a recommendation under its priority and the matching action timeframe"""
+        self.recommendations[priority].append(rec)
+        
+        action, timeframe = _PRIORITY_ACTIONS[priority]
+        self.priorities[action].append({**rec, 'timeframe': timeframe})
+
+    def prioritize_findings(self):
+        """Prioritize findings based on severity and impact"""
+        logger.info("Prioritizing findings")
+        
+        # generate_recommendations files every finding under its action
+        # timeframe as it is created, so the priorities are already complete
+        return True
+    
+    def use_ai_for_analysis(self):
+        """Use AI models to enhance the analysis if available"""
+        if not OPENAI_AVAILABLE and not TRANSFORMERS_AVAILABLE:
+            logger.warning("No AI models available for enhanced analysis")
+            return False
+        
+        logger.info("Using AI for enhanced analysis")
+        
+        # Try to use OpenAI first
+        if OPENAI_AVAILABLE:
+            api_key = os.getenv("OPENAI_API_KEY")
+            if api_key:
+                try:
+                    logger.info("Using OpenAI for analysis")
+                    model = f"OpenAI {OPENAI_MODEL}"
+                    
+                    # Prepare a summary of findings for the AI
+                    prompt = self._prepare_ai_prompt()
+                    
+                    # Reuse the previous answer if these findings were already analyzed
+                    ai_analysis = self._load_cached_ai_response(AI_SYSTEM_PROMPT + prompt, model)
+                    if ai_analysis is None:
+                        import openai  # type: ignore
+                        client = openai.OpenAI(api_key=api_key)
+                        
+                        # Static instructions first so repeated calls hit the prompt prefix cache,
+                        # deterministic output so cached answers stay valid
+                        response = client.chat.completions.create(
+                            model=OPENAI_MODEL,
+                            messages=[
+                                {'role': 'system', 'content': AI_SYSTEM_PROMPT},
+                                {'role': 'user', 'content': prompt}
+                            ],
+                            max_tokens=1000,
+                            temperature=0
+                        )
+                        
+                        # Extract AI analysis
+                        ai_analysis = response.choices[0].message.content.strip()
+                        self._save_cached_ai_response(AI_SYSTEM_PROMPT + prompt, model, ai_analysis)
+                    else:
+                        logger.info("Using cached OpenAI analysis")
+                    
+                    # Add AI analysis to the results
+                    self.analysis['ai_enhanced'] = {
+                        'model': model,
+                        'analysis': ai_analysis
+                    }
+                    
+                    logger.info("OpenAI analysis completed")
+                    return True
+                except Exception as e:
+                    logger.error(f"Error using OpenAI: {e}")
+        
+        # Fall back to transformers if OpenAI is not available or failed
+        if TRANSFORMERS_AVAILABLE:
+            try:
+                logger.info("Using HuggingFace transformers for analysis")
+                model = 'HuggingFace Transformers'
+                
+                # Prepare text to summarize
+                text = self._prepare_transformers_text()
+                
+                # Generate summary
+                if text:
+                    ai_analysis = self._load_cached_ai_response(text, model)
+                    if ai_analysis is None:
+                        summary = self._get_summarizer()(text, max_length=250, min_length=50, do_sample=False)
+                        ai_analysis = summary[0]['summary_text']
+                        self._save_cached_ai_response(text, model, ai_analysis)
+                    else:
+                        logger.info("Using cached transformers analysis")
+                    
+                    # Add AI analysis to the results
+                    self.analysis['ai_enhanced'] = {
+                        'model': model,
+                        'analysis': ai_analysis
+                    }
+                    
+                    logger.info("Transformers analysis completed")
+                    return True
+                else:
+                    logger.warning("Not enough text for transformers to analyze")
+            except Exception as e:
+                logger.error(f"Error using transformers: {e}")
+        
+        return False
+
+    def _get_summarizer(self):
+        """Return the summarization pipeline, loading the model on first use"""
+        if self._summarizer is None:
+            from transformers import pipeline  # type: ignore
+            self._summarizer = pipeline("summarization", model=SUMMARIZATION_MODEL)
+        return self._summarizer
+
+    def _ai_cache_path(self, prompt, model):
+        """Return the cache file for the AI response to a prompt"""
+        key = hashlib.sha256((prompt + model).encode('utf-8')).hexdigest()
+        return os.path.join(self.input_dir, '.ai_cache', f"{key}.json")
+
+    def _load_cached_ai_response(self, prompt, model):
+        """Return a cached AI response for the prompt, or None if missing or expired"""
+        if AI_CACHE_TTL <= 0:
+            return None
+        
+        cache_path = self._ai_cache_path(prompt, model)
+        try:
+            if time.time() - os.path.getmtime(cache_path) > AI_CACHE_TTL:
+                return None
+            return _load_json(cache_path)['analysis']
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+    def _save_cached_ai_response(self, prompt, model, analysis):
+        """Store an AI response so identical prompts can skip the model"""
+        if AI_CACHE_TTL <= 0:
+            return
+        
+        cache_path = self._ai_cache_path(prompt, model)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w') as f:
+                json.dump({'model': model, 'analysis': analysis}, f)
+        except OSError as e:
+            logger.warning(f"Could not cache AI response: {e}")
+
+    def save_results(self, target):
+        """Save analysis results to file with comprehensive remediation steps"""
+        output_dir = f"{self.input_dir}/analysis"
+        if output_dir not in BountyXAI._created_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            BountyXAI._created_dirs.add(output_dir)
+        
+        now = time.localtime()
+        timestamp = time.strftime("%Y%m%d%H%M%S", now)
+        filename_base = f"{output_dir}/{target}_analysis_{timestamp}"
+        
+        # Create the final output structure with enhanced remediation recommendations
+        final_output = {
+            'target': target,
+            'timestamp': timestamp,
+            'scan_date': time.strftime("%Y-%m-%d %H:%M:%S", now),
+            'summary': self.analysis.get('summary', {}),
+            'details': self.analysis.get('details', {}),
+            'recommendations': self.recommendations,
+            'priorities': self.priorities,
+            'remediation_plan': {
+                'immediate_actions': self._format_remediation_plan(self.priorities.get('immediate_action', [])),
+                'short_term_actions': self._format_remediation_plan(self.priorities.get('short_term', [])),
+                'long_term_actions': self._format_remediation_plan(self.priorities.get('long_term', []))
+            }
+        }
+        
+        # Add AI-enhanced analysis if available
+        if 'ai_enhanced' in self.analysis:
+            final_output['ai_enhanced'] = self.analysis['ai_enhanced']
+        
+        # Save in the requested format
+        if self.output_format == 'json':
+            if ORJSON_AVAILABLE:
+                with open(f"{filename_base}.json", 'wb') as f:
+                    f.write(orjson.dumps(final_output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(f"{filename_base}.json", 'w') as f:
+                    json.dump(final_output, f, indent=2)
+            logger.info(f"Results saved to {filename_base}.json")
+        elif self.output_format == 'txt':
+            with open(f"{filename_base}.txt", 'w') as f:
+                self._write_text_report(f, final_output)
+            logger.info(f"Results saved to {filename_base}.txt")
+        elif self.output_format == 'html':
+            with open(f"{filename_base}.html", 'w') as f:
+                self._write_html_report(f, final_output)
+            logger.info(f"Results saved to {filename_base}.html")
+        else:
+            logger.error(f"Unsupported output format: {self.output_format}")
+            return False
+        
+        return True
+
+    def _write_text_report(self, file, data):
+        """Write a text format report"""
+        lines = []
+        append = lines.append
+        
+        append(f"BountyX AI Analysis Report\n")
+        append(f"=========================\n\n")
+        append(f"Target: {data['target']}\n")
+        append(f"Timestamp: {data['timestamp']}\n\n")
+        
+        # Write summary
+        append("Summary\n-------\n")
+        summary = data.get('summary', {})
+        if 'subdomain_count' in summary:
+            append(f"Subdomains found: {summary['subdomain_count']}\n")
+        if 'live_host_count' in summary:
+            append(f"Live hosts found: {summary['live_host_count']}\n")
+        if 'open_port_count' in summary:
+            append(f"Open ports found: {summary['open_port_count']}\n")
+        if 'directory_count' in summary:
+            append(f"Directories found: {summary['directory_count']}\n")
+        if 'vulnerability_count' in summary:
+            vuln_count = summary['vulnerability_count']
+            append(f"Vulnerabilities found:\n")
+            append(f"  Critical: {vuln_count.get('critical', 0)}\n")
+            append(f"  High: {vuln_count.get('high', 0)}\n")
+            append(f"  Medium: {vuln_count.get('medium', 0)}\n")
+            append(f"  Low: {vuln_count.get('low', 0)}\n")
+            append(f"  Info: {vuln_count.get('info', 0)}\n")
+        append("\n")
+        
+        # Write AI-enhanced analysis if available
+        if 'ai_enhanced' in data:
+            append("AI-Enhanced Analysis\n-------------------\n")
+            append(f"Model: {data['ai_enhanced']['model']}\n\n")
+            append(f"{data['ai_enhanced']['analysis']}\n\n")
+        
+        # Write priorities
+        append("Priorities\n----------\n")
+        
+        # Immediate actions
+        append("Immediate Actions (24-48 hours):\n")
+        for action in data['priorities'].get('immediate_action', []):
+            append(f"- {action['title']}\n")
+            append(f"  Description: {action['description']}\n")
+            append(f"  Recommendation: {action['recommendation']}\n\n")
+        
+        # Short term actions
+        append("Short Term Actions (1-2 weeks):\n")
+        for action in data['priorities'].get('short_term', []):
+            append(f"- {action['title']}\n")
+            append(f"  Description: {action['description']}\n")
+            append(f"  Recommendation: {action['recommendation']}\n\n")
+        
+        # Long term actions
+        append("Long Term Actions (1-3 months):\n")
+        for action in data['priorities'].get('long_term', []):
+            append(f"- {action['title']}\n")
+            append(f"  Description: {action['description']}\n")
+            append(f"  Recommendation: {action['recommendation']}\n\n")
+        
+        # Write details
+        append("Details\n-------\n")
+        details = data.get('details', {})
+        
+        # Interesting subdomains
+        if 'interesting_subdomains' in details:
+            append("Interesting Subdomains:\n")
+            for subdomain in details['interesting_subdomains']:
+                append(f"- {subdomain}\n")
+            append("\n")
+        
+        # Open ports
+        if 'open_ports' in details:
+            append("Open Ports:\n")
+            for port in details['open_ports']:
+                append(f"- Port {port['port']}: {port['service']} ({port.get('version', 'unknown')})\n")
+            append("\n")
+        
+        # Interesting directories
+        if 'interesting_directories' in details:
+            append("Interesting Directories:\n")
+            for directory in details['interesting_directories']:
+                append(f"- {directory['url']} [Status: {directory.get('status', 'unknown')}]\n")
+            append("\n")
+        
+        # Vulnerabilities
+        if 'vulnerabilities' in details:
+            append("Vulnerabilities:\n")
+            for vuln in details['vulnerabilities']:
+                append(f"- {vuln.get('title', 'Unnamed vulnerability')} [{vuln.get('severity', 'unknown').upper()}]\n")
+                append(f"  Description: {vuln.get('description', 'No description')}\n")
+                if 'recommendation' in vuln:
+                    append(f"  Recommendation: {vuln['recommendation']}\n")
+                append("\n")
+        
+        file.write(''.join(lines))
+
+    def _write_html_report(self, file, data):
+        """Write an HTML format report"""
+        if JINJA2_AVAILABLE:
+            _get_template_env().get_template('report.html.j2').stream(data=data).dump(file)
+        else:
+            self._write_plain_html_report(file, data)
+
+    def _write_plain_html_report(self, file, data):
+        """Write an HTML format report without a template engine.
+        Scan-derived values are HTML-escaped, matching the autoescaping template"""
+        # Collect fragments in this thread's reusable buffer and write them in one call
+        buffer = self._get_report_buffer()
+        w = buffer.write
+        w(_get_html_head())
+        w(
+            f'<div class="header"><h1>BountyX AI Analysis Report</h1>'
+            f'<p>Target: {escape(str(data["target"]))}</p><p>Generated: {data["timestamp"]}</p></div>\n'
+        )
+        
+        # Add summary section
+        w(_HTML_SUMMARY_OPEN)
+        
+        summary = data.get('summary', {})
+        
+        if 'subdomain_count' in summary:
+            w(f'<div class="summary-item"><h3>Subdomains</h3><p>{summary["subdomain_count"]}</p></div>\n')
+        
+        if 'live_host_count' in summary:
+            w(f'<div class="summary-item"><h3>Live Hosts</h3><p>{summary["live_host_count"]}</p></div>\n')
+        
+        if 'open_port_count' in summary:
+            w(f'<div class="summary-item"><h3>Open Ports</h3><p>{summary["open_port_count"]}</p></div>\n')
+        
+        if 'directory_count' in summary:
+            w(f'<div class="summary-item"><h3>Directories</h3><p>{summary["directory_count"]}</p></div>\n')
+        
+        if 'vulnerability_count' in summary:
+            vuln_count = summary['vulnerability_count']
+            w(
+                f'<div class="summary-item"><h3>Vulnerabilities</h3>'
+                f'<p>Critical: {vuln_count.get("critical", 0)}<br>High: {vuln_count.get("high", 0)}<br>'
+                f'Medium: {vuln_count.get("medium", 0)}<br>Low: {vuln_count.get("low", 0)}<br>'
+                f'Info: {vuln_count.get("info", 0)}</p></div>\n'
+            )
+        
+        w(_HTML_SECTION_BOX_CLOSE)
+        
+        # Add AI-enhanced section if available
+        if 'ai_enhanced' in data:
+            analysis = escape(str(data['ai_enhanced']['analysis'])).replace('\n', '<br>')
+            w(
+                f'<div class="section ai-section"><h2>AI-Enhanced Analysis</h2>'
+                f'<p><strong>Model:</strong> {escape(str(data["ai_enhanced"]["model"]))}</p>'
+                f'<p>{analysis}</p></div>\n'
+            )
+        
+        # Add priorities section
+        w(_HTML_PRIORITIES_OPEN)
+        
+        # Immediate actions
+        w(_HTML_IMMEDIATE_OPEN)
+        
+        for title, description, recommendation in self._escape_actions(data['priorities'].get('immediate_action', [])):
+            w(
+                f'<div class="priority-immediate"><h4>{title}</h4>'
+                f'<p><strong>Description:</strong> {description}</p>'
+                f'<p><strong>Recommendation:</strong> {recommendation}</p></div>\n'
+            )
+        
+        w(_HTML_SUBSECTION_CLOSE)
+        
+        # Short term actions
+        w(_HTML_SHORT_TERM_OPEN)
+        
+        for title, description, recommendation in self._escape_actions(data['priorities'].get('short_term', [])):
+            w(
+                f'<div class="priority-short"><h4>{title}</h4>'
+                f'<p><strong>Description:</strong> {description}</p>'
+                f'<p><strong>Recommendation:</strong> {recommendation}</p></div>\n'
+            )
+        
+        w(_HTML_SUBSECTION_CLOSE)
+        
+        # Long term actions
+        w(_HTML_LONG_TERM_OPEN)
+        
+        for title, description, recommendation in self._escape_actions(data['priorities'].get('long_term', [])):
+            w(
+                f'<div class="priority-long"><h4>{title}</h4>'
+                f'<p><strong>Description:</strong> {description}</p>'
+                f'<p><strong>Recommendation:</strong> {recommendation}</p></div>\n'
+            )
+        
+        w(_HTML_SECTION_BOX_CLOSE)
+        
+        # Add details section, leaving out subsections with nothing to list
+        w(_HTML_DETAILS_OPEN)
+        details = data.get('details', {})
+        
+        # Interesting subdomains
+        subdomains = details.get('interesting_subdomains')
+        if subdomains:
+            w(_HTML_SUBDOMAINS_OPEN)
+            
+            w(''.join([f"<li>{escape(str(subdomain))}</li>\n" for subdomain in subdomains]))
+            
+            w(_HTML_LIST_CLOSE)
+        
+        # Open ports
+        open_ports = details.get('open_ports')
+        if open_ports:
+            w(_HTML_PORTS_OPEN)
+            
+            # Render and escape the whole table body in one comprehension, written once
+            w(''.join([
+                f"<tr><td>{escape(str(port['port']))}</td><td>{escape(str(port['service']))}</td>"
+                f"<td>{escape(str(port.get('version', 'unknown')))}</td></tr>\n"
+                for port in open_ports
+            ]))
+            
+            w(_HTML_TABLE_CLOSE)
+        
+        # Interesting directories
+        directories = details.get('interesting_directories')
+        if directories:
+            w(_HTML_DIRECTORIES_OPEN)
+            
+            w(''.join([
+                f"<tr><td>{escape(str(directory['url']))}</td><td>{escape(str(directory.get('status', 'unknown')))}</td></tr>\n"
+                for directory in directories
+            ]))
+            
+            w(_HTML_TABLE_CLOSE)
+        
+        # Vulnerabilities
+        vulnerabilities = details.get('vulnerabilities')
+        if vulnerabilities:
+            w(_HTML_VULNERABILITIES_OPEN)
+            
+            w(''.join([self._render_vulnerability_html(vuln) for vuln in vulnerabilities]))
+
+            w(_HTML_VULNERABILITIES_CLOSE)
 
-# Example of properly redacting sensitive information in logs:
-function logSanitizer(logObject) {
-  const sensitiveFields = ['password', 'token', 'ssn', 'creditCard', 'secret'];
-  
-  return Object.keys(logObject).reduce((acc, key) => {
-    if (sensitiveFields.includes(key.toLowerCase())) {
-      acc[key] = '[REDACTED]';
-    } else {
-      acc[key] = logObject[key];
-    }
-    return acc;
-  }, {});
-}
-                """,
-                'references': [
-                    "OWASP Information Leakage Guide: https://owasp.org/www-project-web-security-testing-guide/latest/4-Web_Application_Security_Testing/01-Information_Gathering/07-Map_Application_Architecture"
-                ]
-            },
-            'directory listing': {
-                'summary': "Disable directory listing to prevent unauthorized browsing of server directories",
-                'steps': [
-                    "Disable directory listing in web server configuration",
-                    "Create index files in all directories that need to be accessed",
-                    "Configure a custom 403 Forbidden page",
-                    "Use access controls to restrict directory access",
-                    "Regularly audit accessible directories"
-                ],
-                'code_example': """
-# Apache configuration (.htaccess):
-Options -Indexes
-ErrorDocument 403 /error/forbidden.html
+        w(_HTML_FOOT)
+        file.write(buffer.getvalue())
 
-# Nginx configuration:
-server {
-    # ...
-    
-    # Disable directory listing
-    autoindex off;
-    
-    # Custom error page
-    error_page 403 /error/forbidden.html;
-    
-    # ...
-}
-                """,
-                'references': [
-                    "OWASP Testing for Directory Traversal: https://owasp.org/www-project-web-security-testing-guide/latest/4-Web_Application_Security_Testing/05-Authorization_Testing/01-Testing_Directory_Traversal_File_Include"
-                ]
-            },
-            'default credentials': {
-                'summary': "Eliminate default credential vulnerabilities by changing passwords and implementing proper authentication",
-                'steps': [
-                    "Change all default credentials on all systems and components",
-                    "Implement a strong password policy for all accounts",
-                    "Set up multi-factor authentication (MFA) where possible",
-                    "Audit system accounts regularly",
-                    "Implement password rotation for service accounts"
-                ],
-                'code_example': """
-# Example of strong password policy implementation in Node.js:
-const passwordValidator = require('password-validator');
+    @staticmethod
+    def _get_report_buffer():
+        """Return this thread's report buffer, emptied for reuse"""
+        buffer = getattr(_report_buffers, 'buffer', None)
+        if buffer is None:
+            buffer = _report_buffers.buffer = io.StringIO()
+        else:
+            buffer.seek(0)
+            buffer.truncate(0)
+        return buffer
 
-// Create a password schema
-const passwordSchema = new passwordValidator();
-passwordSchema
-  .is().min(12)                                   // Minimum length 12
-  .is().max(100)                                  // Maximum length 100
-  .has().uppercase()                              // Must have uppercase letters
-  .has().lowercase()                              // Must have lowercase letters
-  .has().digits(2)                                // Must have at least 2 digits
-  .has().not().spaces()                           // Should not have spaces
-  .has().symbols(1)                               // Must have at least 1 symbol
-  .is().not().oneOf(['Password123!', 'Admin123!']); // Blacklist common passwords
+    @staticmethod
+    def _render_vulnerability_html(vuln):
+        """Render one vulnerability block of the plain HTML report"""
+        severity = vuln.get('severity', 'info').lower()
+        css_class = _VULN_CSS_CLASSES.get(severity, 'vuln-low')
 
-// Validate a password
-function validatePassword(password) {
-  return passwordSchema.validate(password, { list: true });
-}
-                """,
-                'references': [
-                    "OWASP Authentication Best Practices: https://cheatsheetseries.owasp.org/cheatsheets/Authentication_Cheat_Sheet.html",
-                    "NIST Password Guidelines: https://pages.nist.gov/800-63-3/sp800-63b.html"
-                ]
-            },
-            'sensitive file': {
-                'summary': "Protect sensitive files by removing them from publicly accessible locations and implementing access controls",
-                'steps': [
-                    "Remove sensitive files from web-accessible directories",
-                    "Move configuration files outside the web root",
-                    "Use environment variables for sensitive configuration",
-                    "Implement proper file permissions",
-                    "Use .gitignore to prevent committing sensitive files"
-                ],
-                'code_example': """
-# Example .gitignore file:
-# Ignore sensitive files
-.env
-.env.*
-config/secrets.yml
-credentials.json
-private_key.pem
-*.key
-*.p12
-*.pfx
-*.password
+        recommendation = ''
+        if 'recommendation' in vuln:
+            recommendation = f"<p><strong>Recommendation:</strong> {escape(str(vuln['recommendation']))}</p>"
 
-# Example of using environment variables instead of config files:
-# Instead of:
-# database.json
-{
-  "host": "db.example.com",
-  "username": "admin",
-  "password": "super-secret-password"
-}
+        return (
+            f'<div class="{css_class}">'
+            f'<h4>{escape(str(vuln.get("title", "Unnamed vulnerability")))} [{escape(severity.upper())}]</h4>'
+            f'<p><strong>Description:</strong> {escape(str(vuln.get("description", "No description")))}</p>'
+            f'{recommendation}</div>\n'
+        )
 
-# Use environment variables:
-const dbConfig = {
-  host: process.env.DB_HOST,
-  username: process.env.DB_USER,
-  password: process.env.DB_PASSWORD
-};
-                """,
-                'references': [
-                    "OWASP Sensitive Data Exposure: https://owasp.org/www-project-top-ten/2017/A3_2017-Sensitive_Data_Exposure",
-                    "The Twelve-Factor App - Config: https://12factor.net/config"
-                ]
-            },
-            'ssl tls': {
-                'summary': "Fix SSL/TLS vulnerabilities by configuring proper protocols, cipher suites, and certificates",
-                'steps': [
-                    "Disable outdated protocols (SSL 2.0, SSL 3.0, TLS 1.0, TLS 1.1)",
-                    "Enable only strong cipher suites",
-                    "Configure proper certificate validation",
-                    "Implement HTTP Strict Transport Security (HSTS)",
-                    "Use secure flag for cookies"
-                ],
-                'code_example': """
-# Nginx secure TLS configuration:
-server {
-    listen 443 ssl;
-    server_name example.com;
-    
-    # TLS configuration
-    ssl_protocols TLSv1.2 TLSv1.3;
-    ssl_prefer_server_ciphers on;
-    ssl_ciphers 'ECDHE-ECDSA-AES256-GCM-SHA384:ECDHE-RSA-AES256-GCM-SHA384:ECDHE-ECDSA-CHACHA20-POLY1305:ECDHE-RSA-CHACHA20-POLY1305:ECDHE-ECDSA-AES128-GCM-SHA256:ECDHE-RSA-AES128-GCM-SHA256';
-    ssl_session_timeout 1d;
-    ssl_session_cache shared:SSL:50m;
-    ssl_session_tickets off;
-    ssl_certificate /path/to/fullchain.pem;
-    ssl_certificate_key /path/to/privkey.pem;
-    
-    # HSTS
-    add_header Strict-Transport-Security "max-age=63072000; includeSubDomains; preload" always;
-    
-    # ...
-}
-                """,
-                'references': [
-                    "Mozilla SSL Configuration Generator: https://ssl-config.mozilla.org/",
-                    "OWASP Transport Layer Protection Cheat Sheet: https://cheatsheetseries.owasp.org/cheatsheets/Transport_Layer_Protection_Cheat_Sheet.html"
-                ]
-            },
-            'cors': {
-                'summary': "Configure proper Cross-Origin Resource Sharing (CORS) policies to prevent unauthorized access",
-                'steps': [
-                    "Specify the exact origins that should be allowed access",
-                    "Limit the HTTP methods allowed for cross-origin requests",
-                    "Restrict which HTTP headers can be used",
-                    "Control whether credentials can be included in cross-origin requests",
-                    "Set appropriate caching directives for preflight responses"
-                ],
-                'code_example': """
-# Example of secure CORS configuration in Express.js:
-const cors = require('cors');
+    @staticmethod
+    def _escape_actions(actions):
+        """HTML-escape the title, description and recommendation of each action"""
+        return [
+            (escape(str(action['title'])), escape(str(action['description'])), escape(str(action['recommendation'])))
+            for action in actions
+        ]
 
-// Basic CORS configuration
-app.use(cors({
-  origin: ['https://example.com', 'https://www.example.com'],
-  methods: ['GET', 'POST'],
-  allowedHeaders: ['Content-Type', 'Authorization'],
-  credentials: true,
-  maxAge: 600 // Cache preflight requests for 10 minutes
-}));
+    def _find_interesting_subdomains(self, subdomains):
+        """Find potentially interesting subdomains"""
+        search = _INTERESTING_SUBDOMAIN_PATTERN.search
+        return [subdomain for subdomain in subdomains if search(subdomain.lower())]
 
-# Example of CORS configuration in Nginx:
-location /api/ {
-  if ($request_method = 'OPTIONS') {
-    add_header 'Access-Control-Allow-Origin' 'https://example.com';
-    add_header 'Access-Control-Allow-Methods' 'GET, POST, OPTIONS';
-    add_header 'Access-Control-Allow-Headers' 'DNT,User-Agent,X-Requested-With,If-Modified-Since,Cache-Control,Content-Type,Range,Authorization';
-    add_header 'Access-Control-Max-Age' '600';
-    add_header 'Content-Type' 'text/plain; charset=utf-8';
-    add_header 'Content-Length' '0';
-    return 204;
-  }
-  
-  add_header 'Access-Control-Allow-Origin' 'https://example.com';
-  add_header 'Access-Control-Allow-Methods' 'GET, POST, OPTIONS';
-  add_header 'Access-Control-Allow-Headers' 'DNT,User-Agent,X-Requested-With,If-Modified-Since,Cache-Control,Content-Type,Range,Authorization';
-  add_header 'Access-Control-Expose-Headers' 'Content-Length,Content-Range';
-  
-  # Pass to backend
-  proxy_pass http://backend;
-}
-                """,
-                'references': [
-                    "OWASP CORS Guide: https://cheatsheetseries.owasp.org/cheatsheets/Cross-Origin_Resource_Sharing_Cheat_Sheet.html",
-                    "MDN CORS: https://developer.mozilla.org/en-US/docs/Web/HTTP/CORS"
-                ]
-            }
-        }
+    def _analyze_ports(self, port_data):
+        """Analyze port scan data"""
+        interesting_ports = []
         
-        # Find the most appropriate recommendation
-        for vuln_type, recommendation in remediation_db.items():
-            if vuln_type in vuln_name_lower or vuln_type in matcher_name_lower:
-                return recommendation
-        
-        # Check for partial matches
-        for vuln_type, recommendation in remediation_db.items():
-            pattern = r'\b' + re.escape(vuln_type.split()[0]) + r'\b'
-            if re.search(pattern, vuln_name_lower) or re.search(pattern, matcher_name_lower):
-                return recommendation
-        
-        # Default generic recommendation if no specific match is found
-        return {
-            'summary': "Review and fix this vulnerability based on security best practices",
-            'steps': [
-                "Identify the root cause of the vulnerability",
-                "Research OWASP guidelines for this type of issue",
-                "Apply security patches or updates if available",
-                "Implement appropriate input validation and output encoding",
-                "Consider adding additional security controls"
-            ],
-            'code_example': """
-# General security best practices:
-1. Apply input validation
-2. Use parameterized queries
-3. Implement output encoding
-4. Follow the principle of least privilege
-5. Keep all software updated
-            """,
-            'references': [
-                "OWASP Top 10: https://owasp.org/www-project-top-ten/",
-                "SANS CWE Top 25: https://www.sans.org/top25-software-errors/"
-            ]
-        }
+        for host in port_data.get('scan_results', []):
+            for port_info in host.get('ports', []):
+                interesting_ports.append({
+                    'host': host.get('host', 'unknown'),
+                    'port': port_info.get('port', 0),
+                    'service': port_info.get('service', 'unknown'),
+                    'version': port_info.get('version', 'unknown')
+                })
+        
+        return interesting_ports
 
-    def _prepare_ai_prompt(self):
-        """Prepare a prompt for AI analysis with focus on remediation recommendations"""
-        # Create a detailed prompt for the AI
-        prompt = """You are a senior cybersecurity expert analyzing bug bounty scan results. 
-Based on the following findings, provide a comprehensive analysis with detailed remediation steps.
-Focus on actionable recommendations with code examples where appropriate.
+    def _find_interesting_directories(self, directories):
+        """Find potentially interesting directories"""
+        search = _INTERESTING_DIRECTORY_PATTERN.search
+        return [directory for directory in directories if search(directory.get('url', '').lower())]
 
-Your response should include:
-1. A concise summary of the most critical findings
-2. Detailed remediation steps for each vulnerability, prioritized by severity
-3. Code examples to fix the most critical issues
-4. References to security best practices and standards
-5. A recommended timeline for addressing each category of findings
+    def _iter_analyzed_vulnerabilities(self, vulnerabilities):
+        """Yield a normalised finding and its lowercased title for each nuclei result and manual check"""
+        for vuln_data in vulnerabilities:
+            # Handle nuclei format
+            if 'results' in vuln_data:
+                for result in vuln_data['results']:
+                    info = result.get('info', {})
+                    
+                    # Lowercase the name once; it also keys the later per-finding lookup
+                    name_lower = info.get('name', '').lower()
+                    yield {
+                        'title': info.get('name', 'Unknown Vulnerability'),
+                        'severity': info.get('severity', 'info'),
+                        'description': info.get('description', ''),
+                        'url': result.get('host', ''),
+                        'recommendation': _lookup_remediation(
+                            name_lower,
+                            result.get('matcher-name', '').lower()
+                        )
+                    }, name_lower
+            # Handle manual checks format
+            elif 'manual_checks' in vuln_data:
+                for check in vuln_data['manual_checks']:
+                    title = check.get('title', '')
+                    title_lower = title.lower()
+                    
+                    # Determine severity based on title content
+                    if 'CRITICAL' in title:
+                        severity = 'critical'
+                    elif 'WARNING' in title:
+                        severity = 'medium'
+                    else:
+                        severity = 'info'
+                    
+                    yield {
+                        'title': title,
+                        'severity': severity,
+                        'description': check.get('content', ''),
+                        'recommendation': _lookup_remediation(title_lower, '')
+                    }, title_lower
 
-"""
+    def _get_recommendation_for_vulnerability(self, vuln, vuln_type, severity):
+        """Generate a detailed recommendation for a specific vulnerability with remediation steps.
+        vuln_type and severity are the finding's title and severity, already lowercased"""
+        # Get the basic recommendation based on vulnerability type
+        recommendation = _lookup_remediation(vuln_type, '')
+        
+        # Add contextual information from the vulnerability details
+        details = vuln.get('details', {})
+        affected_url = details.get('url', vuln.get('url', ''))
+        
+        # Format the recommendation with specific information
+        formatted_recommendation = {
+            'summary': recommendation['summary'],
+            'steps': recommendation['steps'],
+            'code_example': recommendation['code_example'],
+            'references': recommendation['references']
+        }
+        
+        # Add target-specific information if available
+        if affected_url:
+            formatted_recommendation['affected_url'] = affected_url
+            formatted_recommendation['steps'] = [
+                step.replace('{{URL}}', affected_url) for step in formatted_recommendation['steps']
+            ]
+        
+        # Add severity-based prioritization
+        if severity in ['critical', 'high']:
+            formatted_recommendation['timeframe'] = "Immediate (within 24-48 hours)"
+        elif severity == 'medium':
+            formatted_recommendation['timeframe'] = "Short-term (within 1-2 weeks)"
+        else:
+            formatted_recommendation['timeframe'] = "Medium-term (within 1 month)"
+        
+        return formatted_recommendation
+
+    def _prepare_ai_prompt(self) -> str:
+        """Prepare the findings part of the AI prompt (the instructions live in AI_SYSTEM_PROMPT)"""
+        lines: list = []
+        append = lines.append
+        analysis = self.analysis
+        summary = analysis.get('summary')
+        details = analysis.get('details') or {}
         
         # Add summary information
-        if 'summary' in self.analysis:
-            prompt += "\n## SCAN SUMMARY:\n"
-            summary = self.analysis['summary']
+        if summary is not None:
+            append("## SCAN SUMMARY:\n")
             if 'subdomain_count' in summary:
-                prompt += f"- {summary['subdomain_count']} subdomains discovered\n"
+                append(f"- {summary['subdomain_count']} subdomains discovered\n")
             if 'live_host_count' in summary:
-                prompt += f"- {summary['live_host_count']} live hosts found\n"
+                append(f"- {summary['live_host_count']} live hosts found\n")
             if 'open_port_count' in summary:
-                prompt += f"- {summary['open_port_count']} open ports detected\n"
+                append(f"- {summary['open_port_count']} open ports detected\n")
             if 'directory_count' in summary:
-                prompt += f"- {summary['directory_count']} directories enumerated\n"
+                append(f"- {summary['directory_count']} directories enumerated\n")
             if 'vulnerability_count' in summary:
                 vuln_count = summary['vulnerability_count']
-                prompt += f"- Vulnerabilities: {vuln_count.get('critical', 0)} critical, {vuln_count.get('high', 0)} high, {vuln_count.get('medium', 0)} medium, {vuln_count.get('low', 0)} low, {vuln_count.get('info', 0)} info\n"
-            prompt += "\n"
+                append(f"- Vulnerabilities: {vuln_count.get('critical', 0)} critical, {vuln_count.get('high', 0)} high, {vuln_count.get('medium', 0)} medium, {vuln_count.get('low', 0)} low, {vuln_count.get('info', 0)} info\n")
+            append("\n")
         
-        # Add vulnerabilities
-        if 'vulnerabilities' in self.analysis.get('details', {}):
-            prompt += "Vulnerabilities:\n"
-            for vuln in self.analysis['details']['vulnerabilities']:
-                prompt += f"- {vuln.get('title', 'Unknown')} ({vuln.get('severity', 'unknown').upper()}): {vuln.get('description', 'No description')}\n"
-            prompt += "\n"
+        # Add vulnerabilities, skipping the section when there are none
+        vulns = details.get('vulnerabilities')
+        if vulns:
+            append("Vulnerabilities:\n")
+            lines.extend(self._iter_vulnerability_lines(vulns))
+            append("\n")
         
         # Add open ports
-        if 'open_ports' in self.analysis.get('details', {}):
-            prompt += "Open Ports:\n"
-            for port in self.analysis['details']['open_ports']:
-                prompt += f"- Port {port['port']}: {port['service']} ({port.get('version', 'unknown')})\n"
-            prompt += "\n"
+        ports = details.get('open_ports')
+        if ports:
+            append("Open Ports:\n")
+            for port in ports:
+                append(f"- Port {port['port']}: {port['service']} ({port.get('version', 'unknown')})\n")
+            append("\n")
         
         # Add interesting directories
-        if 'interesting_directories' in self.analysis.get('details', {}):
-            prompt += "Interesting Directories:\n"
-            for directory in self.analysis['details']['interesting_directories']:
-                prompt += f"- {directory['url']} [Status: {directory.get('status', 'unknown')}]\n"
-            prompt += "\n"
-        
-        # Add request for analysis
-        prompt += "Based on these findings, please provide:\n"
-        prompt += "1. A concise analysis of the security posture\n"
-        prompt += "2. Prioritized recommendations (immediate, short-term, and long-term)\n"
-        prompt += "3. Any patterns or notable security concerns\n"
-        
-        return prompt
+        directories = details.get('interesting_directories')
+        if directories:
+            append("Interesting Directories:\n")
+            for directory in directories:
+                append(f"- {directory['url']} [Status: {directory.get('status', 'unknown')}]\n")
+            append("\n")
+        
+        return ''.join(lines)
 
-    def _prepare_transformers_text(self):
+    @staticmethod
+    def _iter_vulnerability_lines(vulns):
+        """Yield the prompt line for each vulnerability"""
+        for vuln in vulns:
+            yield f"- {vuln.get('title', 'Unknown')} ({vuln.get('severity', 'unknown').upper()}): {vuln.get('description', 'No description')}\n"
+
+    def _prepare_transformers_text(self) -> Optional[str]:
         """Prepare text for transformers analysis"""
+        analysis = self.analysis
+        summary = analysis.get('summary')
+        details = analysis.get('details') or {}
+        
+        # Without summary counts or findings only the fixed phrases remain, which are
+        # always under the length threshold below, so skip building the text
+        if not (summary or details.get('vulnerabilities') or details.get('interesting_directories')
+                or details.get('open_ports')):
+            logger.warning("Generated text is too short for transformers to analyze effectively")
+            return None
+        
         # Create a summary of the findings
-        text = "Bug bounty scan results summary: "
+        lines = ["Bug bounty scan results summary: "]
+        append = lines.append
         
         # Add summary information
-        if 'summary' in self.analysis:
-            summary = self.analysis['summary']
+        if summary is not None:
             if 'subdomain_count' in summary:
-                text += f"{summary['subdomain_count']} subdomains discovered. "
+                append(f"{summary['subdomain_count']} subdomains discovered. ")
             if 'live_host_count' in summary:
-                text += f"{summary['live_host_count']} live hosts found. "
+                append(f"{summary['live_host_count']} live hosts found. ")
             if 'open_port_count' in summary:
-                text += f"{summary['open_port_count']} open ports detected. "
+                append(f"{summary['open_port_count']} open ports detected. ")
             if 'directory_count' in summary:
-                text += f"{summary['directory_count']} directories enumerated. "
+                append(f"{summary['directory_count']} directories enumerated. ")
             if 'vulnerability_count' in summary:
                 vuln_count = summary['vulnerability_count']
-                text += f"Vulnerabilities: {vuln_count.get('critical', 0)} critical, {vuln_count.get('high', 0)} high, {vuln_count.get('medium', 0)} medium, {vuln_count.get('low', 0)} low, {vuln_count.get('info', 0)} info. "
+                append(f"Vulnerabilities: {vuln_count.get('critical', 0)} critical, {vuln_count.get('high', 0)} high, {vuln_count.get('medium', 0)} medium, {vuln_count.get('low', 0)} low, {vuln_count.get('info', 0)} info. ")
         
-        # Add top vulnerabilities
-        if 'vulnerabilities' in self.analysis.get('details', {}):
-            text += "Most critical vulnerabilities include: "
-            high_severity_vulns = [v for v in self.analysis['details']['vulnerabilities'] 
-                                  if v.get('severity', '').lower() in ['critical', 'high']]
-            
-            for i, vuln in enumerate(high_severity_vulns[:3]):  # Take top 3 critical/high vulns
-                if i > 0:
-                    text += ", "
-                text += f"{vuln.get('title', 'Unknown')} ({vuln.get('severity', '').upper()})"
+        # Add top 3 critical/high vulns, critical first
+        vulns_by_severity = self._vulns_by_severity
+        top_vulns = (vulns_by_severity.get('critical', [])[:3] + vulns_by_severity.get('high', [])[:3])[:3]
+        if top_vulns:
+            append("Most critical vulnerabilities include: ")
+            append(", ".join([f"{vuln.get('title', 'Unknown')} ({vuln.get('severity', '').upper()})"
+                              for vuln in top_vulns]))
         
         # Add notable findings
-        text += " Notable findings include "
+        append(" Notable findings include ")
         
-        if 'interesting_directories' in self.analysis.get('details', {}) and self.analysis['details']['interesting_directories']:
-            text += f"sensitive directories ({len(self.analysis['details']['interesting_directories'])} found), "
+        directories = details.get('interesting_directories')
+        if directories:
+            append(f"sensitive directories ({len(directories)} found), ")
         
-        if 'open_ports' in self.analysis.get('details', {}) and self.analysis['details']['open_ports']:
-            common_services = []
-            for port in self.analysis['details']['open_ports']:
-                if port['service'] not in common_services:
-                    common_services.append(port['service'])
-            text += f"open services ({', '.join(common_services[:3])}), "
+        ports = details.get('open_ports')
+        if ports:
+            # Order-preserving dedupe of the service names
+            common_services = list(dict.fromkeys(port['service'] for port in ports))
+            append(f"open services ({', '.join(common_services[:3])}), ")
         
         # Clean up text
-        text = text.rstrip(", ") + "."
+        text = ''.join(lines).rstrip(", ") + "."
         
         # Ensure the text is substantial enough for the model
         if len(text) < 100:
@@ -1787,19 +1893,70 @@ Your response should include:
         return text
 
 
+# Command-line options, parsed by hand since importing argparse dominates start-up time
+OUTPUT_FORMATS = ('json', 'txt', 'html')
+_CLI_OPTIONS = {'--target': 'target', '--input-dir': 'input_dir', '--output-format': 'output_format'}
+_USAGE_LINE = "usage: ai_helper.py [-h] --target TARGET --input-dir INPUT_DIR [--output-format {json,txt,html}]\n"
+_HELP = _USAGE_LINE + """
+BountyX AI Helper - Analyzes vulnerability scan results
+
+options:
+  -h, --help            show this help message and exit
+  --target TARGET       Target domain or IP
+  --input-dir INPUT_DIR
+                        Input directory containing scan results
+  --output-format {json,txt,html}
+                        Output format
+"""
+
+
+def _usage_error(message):
+    """Print the usage line and an error, then exit like argparse does"""
+    sys.stderr.write(f"{_USAGE_LINE}ai_helper.py: error: {message}\n")
+    sys.exit(2)
+
+
+def _parse_args(argv):
+    """Parse the command-line options into a dict keyed by option name"""
+    args = {'output_format': 'json'}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ('-h', '--help'):
+            sys.stdout.write(_HELP)
+            sys.exit(0)
+        
+        # Accept both "--option value" and "--option=value"
+        option, separator, value = arg.partition('=')
+        name = _CLI_OPTIONS.get(option)
+        if name is None:
+            _usage_error(f"unrecognized arguments: {arg}")
+        if not separator:
+            i += 1
+            if i == len(argv):
+                _usage_error(f"argument {option}: expected one argument")
+            value = argv[i]
+        args[name] = value
+        i += 1
+    
+    missing = [option for option, name in _CLI_OPTIONS.items() if name not in args]
+    if missing:
+        _usage_error(f"the following arguments are required: {', '.join(missing)}")
+    if args['output_format'] not in OUTPUT_FORMATS:
+        choices = ', '.join(repr(output_format) for output_format in OUTPUT_FORMATS)
+        _usage_error(f"argument --output-format: invalid choice: {args['output_format']!r} (choose from {choices})")
+    return args
+
+
 def main():
-    parser = argparse.ArgumentParser(description='BountyX AI Helper - Analyzes vulnerability scan results')
-    parser.add_argument('--target', required=True, help='Target domain or IP')
-    parser.add_argument('--input-dir', required=True, help='Input directory containing scan results')
-    parser.add_argument('--output-format', default='json', choices=['json', 'txt', 'html'], help='Output format')
-    args = parser.parse_args()
+    args = _parse_args(sys.argv[1:])
     
-    logger.info(f"Starting BountyX AI Helper for target: {args.target}")
-    logger.info(f"Using input directory: {args.input_dir}")
-    logger.info(f"Output format: {args.output_format}")
+    logger.info(f"Starting BountyX AI Helper for target: {args['target']}")
+    logger.info(f"Using input directory: {args['input_dir']}")
+    logger.info(f"Output format: {args['output_format']}")
     
     # Create AI helper instance
-    ai_helper = BountyXAI(args.input_dir, args.output_format)
+    ai_helper = BountyXAI(args['input_dir'], args['output_format'])
     
     # Load and analyze results
     if ai_helper.load_results():
@@ -1819,7 +1976,7 @@ def main():
                     logger.info("Successfully prioritized findings")
                     
                     # Save results
-                    if ai_helper.save_results(args.target):
+                    if ai_helper.save_results(args['target']):
                         logger.info("Successfully saved results")
                         return 0
     
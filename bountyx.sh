@@ -230,7 +230,15 @@ run_all_modules() {
 # Run AI analysis
 run_ai_analysis() {
     echo -e "${GREEN}Running AI Analysis on scan results...${NC}"
-    python3 "$SCRIPT_DIR/ai_helper.py" --target "$TARGET" --input-dir "$OUTPUT_DIR" --output-format "$OUTPUT_FORMAT"
+    # Use the mypyc build from install.sh only while it is newer than the source,
+    # so a pulled or edited ai_helper.py is never shadowed by stale compiled code
+    local compiled_helper=$(ls -t "$SCRIPT_DIR"/ai_helper.*.so 2>/dev/null | head -n 1)
+    if [[ -n "$compiled_helper" && "$compiled_helper" -nt "$SCRIPT_DIR/ai_helper.py" ]]; then
+        PYTHONPATH="$SCRIPT_DIR${PYTHONPATH:+:$PYTHONPATH}" python3 -c 'import sys, ai_helper; sys.exit(ai_helper.main())' \
+            --target "$TARGET" --input-dir "$OUTPUT_DIR" --output-format "$OUTPUT_FORMAT"
+    else
+        python3 "$SCRIPT_DIR/ai_helper.py" --target "$TARGET" --input-dir "$OUTPUT_DIR" --output-format "$OUTPUT_FORMAT"
+    fi
     echo -e "${GREEN}AI Analysis completed!${NC}"
 }
 
@@ -103,7 +103,6 @@ fi
 echo -e "${BLUE}Installing Python dependencies...${NC}"
 cat > requirements.txt << EOF
 requests
-argparse
 tqdm
 python-dateutil
 EOF
@@ -124,6 +123,41 @@ else
     echo -e "${YELLOW}Transformers module installation failed. AI features will be limited.${NC}"
 fi
 
+# Check for optional speedup modules
+echo -e "${BLUE}Checking for optional speedup modules...${NC}"
+if pip3 install orjson -q; then
+    echo -e "${GREEN}orjson module installed!${NC}"
+else
+    echo -e "${YELLOW}orjson module installation failed. Falling back to the standard json module.${NC}"
+fi
+
+if pip3 install ijson -q; then
+    echo -e "${GREEN}ijson module installed!${NC}"
+else
+    echo -e "${YELLOW}ijson module installation failed. Large result files will be loaded whole.${NC}"
+fi
+
+if pip3 install pyahocorasick -q; then
+    echo -e "${GREEN}pyahocorasick module installed!${NC}"
+else
+    echo -e "${YELLOW}pyahocorasick module installation failed. Falling back to substring matching.${NC}"
+fi
+
+if pip3 install jinja2 -q; then
+    echo -e "${GREEN}Jinja2 module installed!${NC}"
+else
+    echo -e "${YELLOW}Jinja2 module installation failed. HTML reports will use the built-in writer.${NC}"
+fi
+
+# Compile the AI helper to a C extension. bountyx.sh ignores the build once ai_helper.py
+# is newer, so rerun this after updating to get the compiled speedup back
+if pip3 install mypy -q && mypyc ai_helper.py > /dev/null; then
+    echo -e "${GREEN}AI helper compiled with mypyc!${NC}"
+else
+    rm -f ai_helper.*.so
+    echo -e "${YELLOW}mypyc compilation failed. The AI helper will run as plain Python.${NC}"
+fi
+
 echo -e "${GREEN}Python dependencies installed!${NC}"
 
 # Install optional tools